@@ -15,6 +15,10 @@ _ALLOWED: Final[re.Pattern[str]] = re.compile(r"[^A-Z0-9 ._-]+")
 _MULTI_SPACE: Final[re.Pattern[str]] = re.compile(r"\s+")
 _MULTI_DASH: Final[re.Pattern[str]] = re.compile(r"-{2,}")
 
+# Shape of a string canonical_text() would return unchanged (apart from the
+# dash rules, checked separately in is_canonical_text).
+_CANONICAL_SHAPE: Final[re.Pattern[str]] = re.compile(r"[A-Z0-9._-]+(?: [A-Z0-9._-]+)*")
+
 
 def _strip_diacritics(text: str) -> str:
     """
@@ -83,6 +87,20 @@ def canonical_text(text: object) -> str:
     return s.strip()
 
 
+def is_canonical_text(text: str) -> bool:
+    """
+    Cheap check: True when canonical_text(text) == text, so callers can skip
+    the full normalization for input that is already canonical (e.g. typing
+    plain uppercase ASCII). False never means "invalid", only "normalize it".
+    """
+    return (
+        _CANONICAL_SHAPE.fullmatch(text) is not None
+        and "--" not in text
+        and " -" not in text
+        and "- " not in text
+    )
+
+
 def canonical_well_name(text: object) -> str:
     """
     Canonical well name input (v0.1).
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, datetime, time
+from fractions import Fraction
 from typing import Iterable, List, Optional, Sequence, Tuple
 
 
@@ -112,6 +113,22 @@ def format_decimal(value: float, decimals: int = 2) -> str:
     return f"{value:.{decimals}f}"
 
 
+def gauge_inches(whole: int, num: int, den: int) -> str:
+    """
+    Stabilizer gauge whole + num/den as decimal inches, 3 places, trailing
+    zeros dropped. Exact rational math (no float noise).
+    Examples:
+      (12, 1, 8) -> "12.125"
+      (8, 1, 2) -> "8.5"
+      (9, 0, 4) -> "9"
+    """
+    thousandths = round(Fraction(whole * den + num, den) * 1000)
+    units, frac = divmod(thousandths, 1000)
+    if not frac:
+        return str(units)
+    return f"{units}.{frac:03d}".rstrip("0")
+
+
 # -----------------------------
 # Ticket / Nozzle calculations
 # -----------------------------
@@ -0,0 +1,23 @@
+# app/data/_validate.py
+from __future__ import annotations
+
+from typing import Any
+
+
+def clean_key(value: Any) -> str:
+    """
+    Normalizes an id/key argument: stripped text, "" for None/empty.
+    """
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip() if value else ""
+
+
+def require_well(well_id: Any) -> str:
+    """
+    Returns the cleaned well_id; raises ValueError when it is blank.
+    """
+    wid = clean_key(well_id)
+    if not wid:
+        raise ValueError("well_id is required")
+    return wid
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import re
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
 
 
 DATA_DIR = Path(__file__).resolve().parent
@@ -9,22 +13,78 @@ DB_PATH = DATA_DIR / "wellops.db"
 SCHEMA_PATH = DATA_DIR / "schema.sql"
 SCHEMA_VERSION = "2025.02.20"
 
+# sqlite3 keeps compiled statements per connection keyed by SQL text; repos pass
+# module-level SQL constants so every save/read hits this cache.
+STATEMENT_CACHE_SIZE = 256
+
+
+# One connection per thread, opened on first use and kept for the life of the
+# thread so its page cache, statement cache and PRAGMA state are reused.
+_local = threading.local()
+
 
 def get_connection() -> sqlite3.Connection:
     """
-    Returns a SQLite connection and ensures schema is applied.
+    Returns this thread's shared SQLite connection (schema ensured on open).
+
+    The connection is in autocommit mode (isolation_level=None): wrap writes
+    that must apply together in transaction(). Callers must not close it.
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.path == DB_PATH:
+        return conn
+
+    conn = sqlite3.connect(
+        DB_PATH,
+        isolation_level=None,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
     conn.row_factory = sqlite3.Row
 
+    _apply_pragmas(conn)
     _ensure_schema(conn)
 
+    _local.conn = conn
+    _local.path = DB_PATH
     return conn
 
 
+def _apply_pragmas(conn: sqlite3.Connection) -> None:
+    """
+    Per-connection tuning: WAL journal (readers don't block the writer, one fsync
+    per checkpoint instead of per commit), NORMAL sync, wait on locks, temp in RAM,
+    ~20 MB page cache. Foreign keys are enforced so hole section lines cascade
+    with their section.
+    """
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA busy_timeout = 5000")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -20000")
+    conn.execute("PRAGMA foreign_keys = ON")
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """
+    Runs the block inside one explicit BEGIN IMMEDIATE ... COMMIT.
+    The write lock is taken up front and every statement in the block is
+    committed together (ROLLBACK on error).
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    else:
+        conn.execute("COMMIT")
+
+
 def _ensure_schema(conn: sqlite3.Connection) -> None:
     """
-    Applies schema.sql once (idempotent because schema uses IF NOT EXISTS).
+    Applies schema.sql and column migrations; runs once per new connection
+    (idempotent because schema uses IF NOT EXISTS).
     """
     if not SCHEMA_PATH.exists():
         raise FileNotFoundError(f"schema.sql not found: {SCHEMA_PATH}")
@@ -32,10 +92,11 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
     sql = SCHEMA_PATH.read_text(encoding="utf-8")
     # Runs all CREATE TABLE/INDEX statements
     conn.executescript(sql)
-    _ensure_wells_columns(conn)
-    _ensure_hole_section_columns(conn)
-    _ensure_app_meta(conn)
-    conn.commit()
+    with transaction(conn):
+        _ensure_wells_columns(conn)
+        _ensure_hole_section_columns(conn)
+        _ensure_app_meta(conn)
+    _ensure_well_cascade(conn)
 
 
 def _ensure_wells_columns(conn: sqlite3.Connection) -> None:
@@ -186,6 +247,7 @@ def _ensure_hole_section_columns(conn: sqlite3.Connection) -> None:
             conn.execute(f"ALTER TABLE well_hole_section_data ADD COLUMN {col} REAL NULL")
 
     _ensure_nozzle_table(conn)
+    _ensure_hse_line_cascade(conn)
 
 
 def _ensure_nozzle_table(conn: sqlite3.Connection) -> None:
@@ -207,7 +269,9 @@ def _ensure_nozzle_table(conn: sqlite3.Connection) -> None:
           size_32nds INTEGER NOT NULL,
           updated_at TEXT NOT NULL,
           PRIMARY KEY (well_id, hole_key, bit_index, line_no),
-          FOREIGN KEY (well_id) REFERENCES wells(well_id)
+          FOREIGN KEY (well_id) REFERENCES wells(well_id) ON DELETE CASCADE,
+          FOREIGN KEY (well_id, hole_key)
+            REFERENCES well_hole_section_data(well_id, hole_key) ON DELETE CASCADE
         )
         """
     )
@@ -215,14 +279,145 @@ def _ensure_nozzle_table(conn: sqlite3.Connection) -> None:
         """
         INSERT INTO well_hse_nozzle_new
           (well_id, hole_key, bit_index, line_no, count, size_32nds, updated_at)
-        SELECT well_id, hole_key, 1, line_no, count, size_32nds, updated_at
-        FROM well_hse_nozzle
+        SELECT n.well_id, n.hole_key, 1, n.line_no, n.count, n.size_32nds, n.updated_at
+        FROM well_hse_nozzle n
+        JOIN well_hole_section_data d
+          ON d.well_id = n.well_id AND d.hole_key = n.hole_key
         """
     )
     conn.execute("DROP TABLE well_hse_nozzle")
     conn.execute("ALTER TABLE well_hse_nozzle_new RENAME TO well_hse_nozzle")
 
 
+# Ticket / nozzle tables as created before lines cascaded with their section:
+# table -> (CREATE for the rebuilt table, column list).
+_HSE_LINE_TABLES = {
+    "well_hse_ticket": (
+        """
+        CREATE TABLE well_hse_ticket_new (
+          well_id TEXT NOT NULL,
+          hole_key TEXT NOT NULL,
+          line_no INTEGER NOT NULL,
+          ticket_date TEXT NULL,
+          ticket_price_usd REAL NULL,
+          updated_at TEXT NOT NULL,
+          PRIMARY KEY (well_id, hole_key, line_no),
+          FOREIGN KEY (well_id) REFERENCES wells(well_id) ON DELETE CASCADE,
+          FOREIGN KEY (well_id, hole_key)
+            REFERENCES well_hole_section_data(well_id, hole_key) ON DELETE CASCADE
+        )
+        """,
+        "well_id, hole_key, line_no, ticket_date, ticket_price_usd, updated_at",
+    ),
+    "well_hse_nozzle": (
+        """
+        CREATE TABLE well_hse_nozzle_new (
+          well_id TEXT NOT NULL,
+          hole_key TEXT NOT NULL,
+          bit_index INTEGER NOT NULL,
+          line_no INTEGER NOT NULL,
+          count INTEGER NOT NULL,
+          size_32nds INTEGER NOT NULL,
+          updated_at TEXT NOT NULL,
+          PRIMARY KEY (well_id, hole_key, bit_index, line_no),
+          FOREIGN KEY (well_id) REFERENCES wells(well_id) ON DELETE CASCADE,
+          FOREIGN KEY (well_id, hole_key)
+            REFERENCES well_hole_section_data(well_id, hole_key) ON DELETE CASCADE
+        )
+        """,
+        "well_id, hole_key, bit_index, line_no, count, size_32nds, updated_at",
+    ),
+}
+
+
+def _ensure_hse_line_cascade(conn: sqlite3.Connection) -> None:
+    """
+    Rebuilds ticket/nozzle tables of existing DBs so their lines reference
+    well_hole_section_data with ON DELETE CASCADE. Orphan lines are dropped.
+    """
+    for table, (create_sql, cols) in _HSE_LINE_TABLES.items():
+        fks = conn.execute(f"PRAGMA foreign_key_list({table})").fetchall()
+        if not fks or any(fk[2] == "well_hole_section_data" for fk in fks):
+            continue
+
+        conn.execute(create_sql)
+        conn.execute(
+            f"""
+            INSERT INTO {table}_new ({cols})
+            SELECT {cols}
+            FROM {table} t
+            WHERE EXISTS (
+              SELECT 1 FROM well_hole_section_data d
+              WHERE d.well_id = t.well_id AND d.hole_key = t.hole_key
+            )
+            """
+        )
+        conn.execute(f"DROP TABLE {table}")
+        conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+
+
+# Tables whose rows belong to one well; deleting the wells row removes them.
+_WELL_CHILD_TABLES = (
+    "well_identity",
+    "well_trajectory",
+    "well_section_nodes",
+    "well_hole_sections",
+    "well_hole_section_data",
+    "well_hse_ticket",
+    "well_hse_nozzle",
+)
+
+_CREATE_TABLE_NAME_RE = re.compile(r'^CREATE TABLE\s+"?\w+"?', re.IGNORECASE)
+_WELL_FK_RE = re.compile(r"REFERENCES\s+\"?wells\"?\s*\(\s*well_id\s*\)(?!\s*ON\s+DELETE)", re.IGNORECASE)
+
+
+def _ensure_well_cascade(conn: sqlite3.Connection) -> None:
+    """
+    Rebuilds per-well tables of existing DBs whose well_id foreign key lacks
+    ON DELETE CASCADE, so delete_well is a single DELETE FROM wells.
+
+    Uses SQLite's documented rebuild (create new, copy, drop, rename) from the
+    table's own stored CREATE statement, so columns added by ALTER are kept.
+    Foreign keys are switched off meanwhile: with them on, dropping
+    well_hole_section_data would cascade into its ticket/nozzle lines.
+    """
+    stale = []
+    for table in _WELL_CHILD_TABLES:
+        fks = conn.execute(f"PRAGMA foreign_key_list({table})").fetchall()
+        if any(fk[2] == "wells" and fk[6].upper() != "CASCADE" for fk in fks):
+            stale.append(table)
+    if not stale:
+        return
+
+    conn.execute("PRAGMA foreign_keys = OFF")
+    try:
+        with transaction(conn):
+            for table in stale:
+                create_sql, = conn.execute(
+                    "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+                    (table,),
+                ).fetchone()
+                index_sql = [
+                    r[0]
+                    for r in conn.execute(
+                        "SELECT sql FROM sqlite_master"
+                        " WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+                        (table,),
+                    )
+                ]
+                create_sql = _CREATE_TABLE_NAME_RE.sub(f"CREATE TABLE {table}_new", create_sql, count=1)
+                create_sql = _WELL_FK_RE.sub("REFERENCES wells(well_id) ON DELETE CASCADE", create_sql)
+
+                conn.execute(create_sql)
+                conn.execute(f"INSERT INTO {table}_new SELECT * FROM {table}")
+                conn.execute(f"DROP TABLE {table}")
+                conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+                for sql in index_sql:
+                    conn.execute(sql)
+    finally:
+        conn.execute("PRAGMA foreign_keys = ON")
+
+
 def _ensure_app_meta(conn: sqlite3.Connection) -> None:
     conn.execute(
         """
@@ -1,23 +1,36 @@
 from __future__ import annotations
 
-from datetime import date, datetime, timezone
-from typing import Any, Dict, List, Optional
-
-from app.data.db import get_connection
+import json
+import time
+from datetime import date, datetime
+from itertools import chain
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.data._validate import clean_key
+from app.data.db import get_connection, transaction
 from app.core.hole_section_calcs import NozzleLine
 
 
+_gmtime = time.gmtime
+_strftime = time.strftime
+_time = time.time
+
+
 def iso_now() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    # UTC ISO 8601, seconds precision (same text as datetime.isoformat())
+    return _strftime("%Y-%m-%dT%H:%M:%S+00:00", _gmtime(_time()))
 
 
 def _to_float(value: Any) -> Optional[float]:
     if value is None:
         return None
-    s = str(value).strip()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    s = value.strip() if isinstance(value, str) else str(value).strip()
     if not s:
         return None
-    s = s.replace(",", ".")
+    if "," in s:
+        s = s.replace(",", ".")
     try:
         return float(s)
     except ValueError:
@@ -27,30 +40,40 @@ def _to_float(value: Any) -> Optional[float]:
 def _to_float_or_none_token(value: Any) -> Optional[float | str]:
     if value is None:
         return None
-    s = str(value).strip()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    s = value.strip() if isinstance(value, str) else str(value).strip()
     if not s:
         return None
     if s.upper() == "NONE":
         return None
-    s = s.replace(",", ".")
+    if "," in s:
+        s = s.replace(",", ".")
     try:
         return float(s)
     except ValueError:
         return None
 
 
+def _to_text(value: Any) -> str:
+    return (value or "").strip()
+
 
+_TRUE_TOKENS = frozenset({"1", "true", "yes", "y", "on", "t"})
 
 
 def _to_int_flag(value: Any) -> int:
     if value is None:
         return 0
     if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
         return 1 if value else 0
-    s = str(value).strip().lower()
-    if s in ("1", "true", "yes", "y"):
-        return 1
-    return 0
+    return 1 if str(value).strip().lower() in _TRUE_TOKENS else 0
+
+
+# accepted date inputs: dd.MM.yyyy (UI), yyyy-mm-dd (ISO)
+_DATE_FORMATS = ("%d.%m.%Y", "%Y-%m-%d")
 
 
 def _to_iso_date(value: Any) -> Optional[str]:
@@ -60,103 +83,341 @@ def _to_iso_date(value: Any) -> Optional[str]:
         return value.isoformat()
     if isinstance(value, datetime):
         return value.date().isoformat()
-    s = str(value).strip()
+    s = value.strip() if isinstance(value, str) else str(value).strip()
     if not s:
         return None
-    # accept dd.MM.yyyy
-    try:
-        return datetime.strptime(s, "%d.%m.%Y").date().isoformat()
-    except Exception:
-        pass
-    # accept yyyy-mm-dd
-    try:
-        return datetime.strptime(s, "%Y-%m-%d").date().isoformat()
-    except Exception:
-        return None
+    # zero-padded forms are split by hand; other spellings go through strptime
+    if len(s) == 10:
+        if s[4] == "-" and s[7] == "-":
+            y, m, d = s[:4], s[5:7], s[8:]
+        elif s[2] == "." and s[5] == ".":
+            d, m, y = s[:2], s[3:5], s[6:]
+        else:
+            y = m = d = ""
+        if y and (y + m + d).isdigit():
+            try:
+                return date(int(y), int(m), int(d)).isoformat()
+            except ValueError:
+                return None
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(s, fmt).date().isoformat()
+        except ValueError:
+            pass
+    return None
+
+
+# (well_id, hole_key) -> (updated_at, loaded section). A cached section is
+# served while its updated_at is unchanged; saves and deletes drop the entry.
+_cache: Dict[Tuple[str, str], Tuple[str, Dict[str, Any]]] = {}
+
+_SQL_SELECT_HOLE_SECTION_STAMP = """
+    SELECT updated_at
+    FROM well_hole_section_data
+    WHERE well_id = ? AND hole_key = ?
+"""
+
+# Section row plus its ticket and nozzle lines (as JSON arrays) in one query.
+_SQL_SELECT_HOLE_SECTION = """
+    SELECT
+      d.*,
+      (
+        SELECT json_group_array(
+          json_object('line_no', line_no, 'ticket_date', ticket_date, 'ticket_price_usd', ticket_price_usd)
+        )
+        FROM (
+          SELECT line_no, ticket_date, ticket_price_usd
+          FROM well_hse_ticket
+          WHERE well_id = d.well_id AND hole_key = d.hole_key
+          ORDER BY line_no
+        )
+      ) AS tickets_json,
+      (
+        SELECT json_group_array(json_array(bit_index, count, size_32nds))
+        FROM (
+          SELECT bit_index, count, size_32nds
+          FROM well_hse_nozzle
+          WHERE well_id = d.well_id AND hole_key = d.hole_key
+          ORDER BY bit_index, line_no
+        )
+      ) AS nozzles_json
+    FROM well_hole_section_data d
+    WHERE d.well_id = ? AND d.hole_key = ?
+"""
+
+# Column order shared by the UPSERT statement and the parameter tuple built in
+# save_hole_section, so the two can never drift apart.
+_HOLE_SECTION_COLS = (
+    "mud_motor_brand",
+    "mud_motor_size",
+    "mud_motor_sleeve_stb_gauge_in",
+    "mud_motor_bend_angle_deg",
+    "mud_motor_lobe",
+    "mud_motor_stage",
+    "mud_motor_ibs_gauge_in",
+    "mud_motor1_brand",
+    "mud_motor1_size",
+    "mud_motor1_sleeve_stb_gauge_in",
+    "mud_motor1_sleeve_none",
+    "mud_motor1_bend_angle_deg",
+    "mud_motor1_lobe",
+    "mud_motor1_stage",
+    "mud_motor1_ibs_gauge_in",
+    "mud_motor1_ibs_none",
+    "mud_motor2_brand",
+    "mud_motor2_size",
+    "mud_motor2_sleeve_stb_gauge_in",
+    "mud_motor2_sleeve_none",
+    "mud_motor2_bend_angle_deg",
+    "mud_motor2_lobe",
+    "mud_motor2_stage",
+    "mud_motor2_ibs_gauge_in",
+    "mud_motor2_ibs_none",
+    "bit_brand",
+    "bit_kind",
+    "bit_type",
+    "bit_iadc",
+    "bit_serial",
+    "bit1_brand",
+    "bit1_kind",
+    "bit1_type",
+    "bit1_iadc",
+    "bit1_serial",
+    "bit2_brand",
+    "bit2_kind",
+    "bit2_type",
+    "bit2_iadc",
+    "bit2_serial",
+    "personnel_day_dd_1",
+    "personnel_day_dd_2",
+    "personnel_day_dd_3",
+    "personnel_night_dd_1",
+    "personnel_night_dd_2",
+    "personnel_night_dd_3",
+    "personnel_day_mwd_1",
+    "personnel_day_mwd_2",
+    "personnel_day_mwd_3",
+    "personnel_night_mwd_1",
+    "personnel_night_mwd_2",
+    "personnel_night_mwd_3",
+    "info_casing_shoe",
+    "info_casing_od",
+    "info_casing_id",
+    "info_section_tvd",
+    "info_section_md",
+    "info_mud_type",
+    "ta_call_out_date",
+    "ta_crew_mob_time",
+    "ta_standby_time_hrs_run1",
+    "ta_standby_time_hrs_run2",
+    "ta_standby_time_hrs_run3",
+    "ta_ru_time_hrs_run1",
+    "ta_ru_time_hrs_run2",
+    "ta_ru_time_hrs_run3",
+    "ta_tripping_time_hrs_run1",
+    "ta_tripping_time_hrs_run2",
+    "ta_tripping_time_hrs_run3",
+    "ta_circulation_time_hrs_run1",
+    "ta_circulation_time_hrs_run2",
+    "ta_circulation_time_hrs_run3",
+    "ta_rotary_time_hrs_run1",
+    "ta_rotary_time_hrs_run2",
+    "ta_rotary_time_hrs_run3",
+    "ta_rotary_meters_run1",
+    "ta_rotary_meters_run2",
+    "ta_rotary_meters_run3",
+    "ta_sliding_time_hrs_run1",
+    "ta_sliding_time_hrs_run2",
+    "ta_sliding_time_hrs_run3",
+    "ta_sliding_meters_run1",
+    "ta_sliding_meters_run2",
+    "ta_sliding_meters_run3",
+    "ta_npt_due_to_rig_hrs_run1",
+    "ta_npt_due_to_rig_hrs_run2",
+    "ta_npt_due_to_rig_hrs_run3",
+    "ta_npt_due_to_motor_hrs_run1",
+    "ta_npt_due_to_motor_hrs_run2",
+    "ta_npt_due_to_motor_hrs_run3",
+    "ta_npt_due_to_mwd_hrs_run1",
+    "ta_npt_due_to_mwd_hrs_run2",
+    "ta_npt_due_to_mwd_hrs_run3",
+    "ta_brt_hrs_run1",
+    "ta_brt_hrs_run2",
+    "ta_brt_hrs_run3",
+    "ta_release_date",
+    "ta_release_time",
+)
+
+_SQL_UPSERT_HOLE_SECTION = (
+    "INSERT INTO well_hole_section_data (well_id, hole_key, "
+    + ", ".join(_HOLE_SECTION_COLS)
+    + ", updated_at) VALUES (?, ?, "
+    + ", ".join("?" * len(_HOLE_SECTION_COLS))
+    + ", ?) ON CONFLICT (well_id, hole_key) DO UPDATE SET "
+    + ", ".join(f"{c} = excluded.{c}" for c in _HOLE_SECTION_COLS)
+    + ", updated_at = excluded.updated_at"
+)
+
+# Coercer per column for values read straight from the same key in `data`.
+# Columns not listed here (and not derived in save_hole_section) are text.
+_COERCERS = {
+    "ta_call_out_date": _to_iso_date,
+    "ta_release_date": _to_iso_date,
+    "ta_standby_time_hrs_run2": _to_float,
+    "ta_standby_time_hrs_run3": _to_float,
+    "ta_ru_time_hrs_run2": _to_float,
+    "ta_ru_time_hrs_run3": _to_float,
+    "ta_tripping_time_hrs_run2": _to_float,
+    "ta_tripping_time_hrs_run3": _to_float,
+    "ta_circulation_time_hrs_run2": _to_float,
+    "ta_circulation_time_hrs_run3": _to_float,
+    "ta_rotary_time_hrs_run2": _to_float,
+    "ta_rotary_time_hrs_run3": _to_float,
+    "ta_rotary_meters_run2": _to_float,
+    "ta_rotary_meters_run3": _to_float,
+    "ta_sliding_time_hrs_run2": _to_float,
+    "ta_sliding_time_hrs_run3": _to_float,
+    "ta_sliding_meters_run2": _to_float,
+    "ta_sliding_meters_run3": _to_float,
+    "ta_npt_due_to_rig_hrs_run2": _to_float,
+    "ta_npt_due_to_rig_hrs_run3": _to_float,
+    "ta_npt_due_to_motor_hrs_run2": _to_float,
+    "ta_npt_due_to_motor_hrs_run3": _to_float,
+    "ta_npt_due_to_mwd_hrs_run2": _to_float,
+    "ta_npt_due_to_mwd_hrs_run3": _to_float,
+    "ta_brt_hrs_run2": _to_float,
+    "ta_brt_hrs_run3": _to_float,
+}
+
+# run1 columns fall back to the legacy single-run key when left blank.
+_RUN1_LEGACY_KEYS = {
+    "ta_standby_time_hrs_run1": "ta_standby_time_hrs",
+    "ta_ru_time_hrs_run1": "ta_ru_time_hrs",
+    "ta_tripping_time_hrs_run1": "ta_tripping_time_hrs",
+    "ta_circulation_time_hrs_run1": "ta_circulation_time_hrs",
+    "ta_rotary_time_hrs_run1": "ta_rotary_time_hrs",
+    "ta_rotary_meters_run1": "ta_rotary_meters",
+    "ta_sliding_time_hrs_run1": "ta_sliding_time_hrs",
+    "ta_sliding_meters_run1": "ta_sliding_meters",
+    "ta_npt_due_to_rig_hrs_run1": "ta_npt_due_to_rig_hrs",
+    "ta_npt_due_to_motor_hrs_run1": "ta_npt_due_to_motor_hrs",
+    "ta_npt_due_to_mwd_hrs_run1": "ta_npt_due_to_mwd_hrs",
+    "ta_brt_hrs_run1": "ta_total_brt_hrs",
+}
+
+_SQL_DELETE_TICKET_LINE = """
+    DELETE FROM well_hse_ticket
+    WHERE well_id = ? AND hole_key = ? AND line_no = ?
+"""
+
+_SQL_TRIM_NOZZLES = """
+    DELETE FROM well_hse_nozzle
+    WHERE well_id = ? AND hole_key = ? AND bit_index = ? AND line_no > ?
+"""
+
+# Lines are keyed by their primary key, so rewriting a line replaces it in
+# place and only blank or surplus lines need deleting.
+_SQL_INSERT_TICKET = """
+    INSERT OR REPLACE INTO well_hse_ticket (well_id, hole_key, line_no, ticket_date, ticket_price_usd, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_NOZZLE = """
+    INSERT OR REPLACE INTO well_hse_nozzle (well_id, hole_key, bit_index, line_no, count, size_32nds, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_DELETE_HOLE_SECTION = "DELETE FROM well_hole_section_data WHERE well_id = ? AND hole_key = ?"
 
 
 def get_hole_section(well_id: str, hole_key: str) -> Optional[Dict[str, Any]]:
-    wid = (well_id or "").strip()
-    hkey = (hole_key or "").strip()
+    wid = clean_key(well_id)
+    hkey = clean_key(hole_key)
     if not wid or not hkey:
         return None
 
-    with get_connection() as conn:
-        row = conn.execute(
-            """
-            SELECT *
-            FROM well_hole_section_data
-            WHERE well_id = ? AND hole_key = ?
-            """,
-            (wid, hkey),
-        ).fetchone()
-
-        if not row:
-            return None
-
-        tickets = conn.execute(
-            """
-            SELECT line_no, ticket_date, ticket_price_usd
-            FROM well_hse_ticket
-            WHERE well_id = ? AND hole_key = ?
-            ORDER BY line_no
-            """,
-            (wid, hkey),
-        ).fetchall()
-
-        nozzles = conn.execute(
-            """
-            SELECT bit_index, line_no, count, size_32nds
-            FROM well_hse_nozzle
-            WHERE well_id = ? AND hole_key = ?
-            ORDER BY bit_index, line_no
-            """,
-            (wid, hkey),
-        ).fetchall()
-
-    data = {k: row[k] for k in row.keys()}
-    data["tickets"] = [
-        {
-            "line_no": int(r["line_no"]),
-            "ticket_date": r["ticket_date"],
-            "ticket_price_usd": r["ticket_price_usd"],
-        }
-        for r in tickets
-    ]
+    key = (wid, hkey)
+    conn = get_connection()
+    stamp = conn.execute(
+        _SQL_SELECT_HOLE_SECTION_STAMP,
+        key,
+    ).fetchone()
+
+    if not stamp:
+        _cache.pop(key, None)
+        return None
+
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == stamp[0]:
+        return _copy_section(cached[1])
+
+    cur = conn.execute(
+        _SQL_SELECT_HOLE_SECTION,
+        key,
+    )
+    row = cur.fetchone()
+
+    if not row:
+        return None
+
+    data = dict(zip([d[0] for d in cur.description], row))
+    data["tickets"] = json.loads(data.pop("tickets_json"))
     bit1_nozzles: List[NozzleLine] = []
     bit2_nozzles: List[NozzleLine] = []
-    for r in nozzles:
-        line = NozzleLine(count=int(r["count"]), size_32nds=int(r["size_32nds"]))
-        if int(r["bit_index"]) == 2:
+    for bit_index, count, size_32nds in json.loads(data.pop("nozzles_json")):
+        line = NozzleLine(count=count, size_32nds=size_32nds)
+        if bit_index == 2:
             bit2_nozzles.append(line)
         else:
             bit1_nozzles.append(line)
     data["bit1_nozzles"] = bit1_nozzles
     data["bit2_nozzles"] = bit2_nozzles
 
-    return data
+    _cache[key] = (data["updated_at"], data)
+    return _copy_section(data)
+
+
+def _copy_section(data: Dict[str, Any]) -> Dict[str, Any]:
+    # callers may adjust the returned dict and its line lists (e.g. legacy key
+    # fallbacks), so never hand out the cached objects themselves
+    return {
+        **data,
+        "tickets": [dict(t) for t in data["tickets"]],
+        "bit1_nozzles": list(data["bit1_nozzles"]),
+        "bit2_nozzles": list(data["bit2_nozzles"]),
+    }
+
+
+def clear_cache() -> None:
+    """
+    Drops all cached sections (for writers outside this module, e.g. import).
+    """
+    _cache.clear()
 
 
 def save_hole_section(well_id: str, hole_key: str, data: Dict[str, Any]) -> None:
-    wid = (well_id or "").strip()
-    hkey = (hole_key or "").strip()
+    wid = clean_key(well_id)
+    hkey = clean_key(hole_key)
     if not wid or not hkey:
         raise ValueError("well_id and hole_key are required")
 
     now = iso_now()
+    _get = data.get
 
     def _txt(key: str) -> str:
-        return (data.get(key) or "").strip()
+        return _to_text(_get(key))
 
     def _pick(*keys: str) -> Any:
-        for key in keys:
-            val = data.get(key)
-            if val is None:
-                continue
-            if isinstance(val, str) and not val.strip():
-                continue
-            return val
-        return None
+        # first non-blank value among keys (new column name first, legacy after)
+        return next(
+            (
+                val
+                for key in keys
+                if (val := _get(key)) is not None
+                and not (isinstance(val, str) and not val.strip())
+            ),
+            None,
+        )
 
     mm1_brand = _txt("mud_motor1_brand") or _txt("mud_motor_brand")
     mm1_size = _txt("mud_motor1_size") or _txt("mud_motor_size")
@@ -167,6 +428,14 @@ def save_hole_section(well_id: str, hole_key: str, data: Dict[str, Any]) -> None
     mm1_stage = _txt("mud_motor1_stage") or _txt("mud_motor_stage")
     mm1_ibs_none = _to_int_flag(data.get("mud_motor1_ibs_none"))
     mm1_ibs = None if mm1_ibs_none else _to_float_or_none_token(_pick("mud_motor1_ibs_gauge_in", "mud_motor_ibs_gauge_in"))
+    mm2_sleeve_none = _to_int_flag(_get("mud_motor2_sleeve_none"))
+    mm2_ibs_none = _to_int_flag(_get("mud_motor2_ibs_none"))
+
+    bit1_brand = _txt("bit1_brand")
+    bit1_kind = _txt("bit1_kind")
+    bit1_type = _txt("bit1_type")
+    bit1_iadc = _txt("bit1_iadc")
+    bit1_serial = _txt("bit1_serial")
 
     payload = {
         "mud_motor1_brand": mm1_brand,
@@ -178,15 +447,10 @@ def save_hole_section(well_id: str, hole_key: str, data: Dict[str, Any]) -> None
         "mud_motor1_stage": mm1_stage,
         "mud_motor1_ibs_gauge_in": mm1_ibs,
         "mud_motor1_ibs_none": mm1_ibs_none,
-        "mud_motor2_brand": _txt("mud_motor2_brand"),
-        "mud_motor2_size": _txt("mud_motor2_size"),
-        "mud_motor2_sleeve_stb_gauge_in": (None if _to_int_flag(data.get("mud_motor2_sleeve_none")) else _to_float_or_none_token(data.get("mud_motor2_sleeve_stb_gauge_in"))),
-        "mud_motor2_sleeve_none": _to_int_flag(data.get("mud_motor2_sleeve_none")),
-        "mud_motor2_bend_angle_deg": _txt("mud_motor2_bend_angle_deg"),
-        "mud_motor2_lobe": _txt("mud_motor2_lobe"),
-        "mud_motor2_stage": _txt("mud_motor2_stage"),
-        "mud_motor2_ibs_gauge_in": (None if _to_int_flag(data.get("mud_motor2_ibs_none")) else _to_float_or_none_token(data.get("mud_motor2_ibs_gauge_in"))),
-        "mud_motor2_ibs_none": _to_int_flag(data.get("mud_motor2_ibs_none")),
+        "mud_motor2_sleeve_stb_gauge_in": None if mm2_sleeve_none else _to_float_or_none_token(_get("mud_motor2_sleeve_stb_gauge_in")),
+        "mud_motor2_sleeve_none": mm2_sleeve_none,
+        "mud_motor2_ibs_gauge_in": None if mm2_ibs_none else _to_float_or_none_token(_get("mud_motor2_ibs_gauge_in")),
+        "mud_motor2_ibs_none": mm2_ibs_none,
         "mud_motor_brand": mm1_brand,
         "mud_motor_size": mm1_size,
         "mud_motor_sleeve_stb_gauge_in": mm1_sleeve,
@@ -194,571 +458,81 @@ def save_hole_section(well_id: str, hole_key: str, data: Dict[str, Any]) -> None
         "mud_motor_lobe": mm1_lobe,
         "mud_motor_stage": mm1_stage,
         "mud_motor_ibs_gauge_in": mm1_ibs,
-        "bit1_brand": _txt("bit1_brand"),
-        "bit1_kind": _txt("bit1_kind"),
-        "bit1_type": _txt("bit1_type"),
-        "bit1_iadc": _txt("bit1_iadc"),
-        "bit1_serial": _txt("bit1_serial"),
-        "bit2_brand": _txt("bit2_brand"),
-        "bit2_kind": _txt("bit2_kind"),
-        "bit2_type": _txt("bit2_type"),
-        "bit2_iadc": _txt("bit2_iadc"),
-        "bit2_serial": _txt("bit2_serial"),
-        "bit_brand": _txt("bit1_brand"),
-        "bit_kind": _txt("bit1_kind"),
-        "bit_type": _txt("bit1_type"),
-        "bit_iadc": _txt("bit1_iadc"),
-        "bit_serial": _txt("bit1_serial"),
-        "personnel_day_dd_1": _txt("personnel_day_dd_1"),
-        "personnel_day_dd_2": _txt("personnel_day_dd_2"),
-        "personnel_day_dd_3": _txt("personnel_day_dd_3"),
-        "personnel_night_dd_1": _txt("personnel_night_dd_1"),
-        "personnel_night_dd_2": _txt("personnel_night_dd_2"),
-        "personnel_night_dd_3": _txt("personnel_night_dd_3"),
-        "personnel_day_mwd_1": _txt("personnel_day_mwd_1"),
-        "personnel_day_mwd_2": _txt("personnel_day_mwd_2"),
-        "personnel_day_mwd_3": _txt("personnel_day_mwd_3"),
-        "personnel_night_mwd_1": _txt("personnel_night_mwd_1"),
-        "personnel_night_mwd_2": _txt("personnel_night_mwd_2"),
-        "personnel_night_mwd_3": _txt("personnel_night_mwd_3"),
-        "info_casing_shoe": _txt("info_casing_shoe"),
-        "info_casing_od": _txt("info_casing_od"),
-        "info_casing_id": _txt("info_casing_id"),
-        "info_section_tvd": _txt("info_section_tvd"),
-        "info_section_md": _txt("info_section_md"),
-        "info_mud_type": _txt("info_mud_type"),
-        "ta_call_out_date": _to_iso_date(data.get("ta_call_out_date")),
-        "ta_crew_mob_time": _txt("ta_crew_mob_time"),
-        "ta_standby_time_hrs_run1": _to_float(_pick("ta_standby_time_hrs_run1", "ta_standby_time_hrs")),
-        "ta_standby_time_hrs_run2": _to_float(data.get("ta_standby_time_hrs_run2")),
-        "ta_standby_time_hrs_run3": _to_float(data.get("ta_standby_time_hrs_run3")),
-        "ta_ru_time_hrs_run1": _to_float(_pick("ta_ru_time_hrs_run1", "ta_ru_time_hrs")),
-        "ta_ru_time_hrs_run2": _to_float(data.get("ta_ru_time_hrs_run2")),
-        "ta_ru_time_hrs_run3": _to_float(data.get("ta_ru_time_hrs_run3")),
-        "ta_tripping_time_hrs_run1": _to_float(_pick("ta_tripping_time_hrs_run1", "ta_tripping_time_hrs")),
-        "ta_tripping_time_hrs_run2": _to_float(data.get("ta_tripping_time_hrs_run2")),
-        "ta_tripping_time_hrs_run3": _to_float(data.get("ta_tripping_time_hrs_run3")),
-        "ta_circulation_time_hrs_run1": _to_float(_pick("ta_circulation_time_hrs_run1", "ta_circulation_time_hrs")),
-        "ta_circulation_time_hrs_run2": _to_float(data.get("ta_circulation_time_hrs_run2")),
-        "ta_circulation_time_hrs_run3": _to_float(data.get("ta_circulation_time_hrs_run3")),
-        "ta_rotary_time_hrs_run1": _to_float(_pick("ta_rotary_time_hrs_run1", "ta_rotary_time_hrs")),
-        "ta_rotary_time_hrs_run2": _to_float(data.get("ta_rotary_time_hrs_run2")),
-        "ta_rotary_time_hrs_run3": _to_float(data.get("ta_rotary_time_hrs_run3")),
-        "ta_rotary_meters_run1": _to_float(_pick("ta_rotary_meters_run1", "ta_rotary_meters")),
-        "ta_rotary_meters_run2": _to_float(data.get("ta_rotary_meters_run2")),
-        "ta_rotary_meters_run3": _to_float(data.get("ta_rotary_meters_run3")),
-        "ta_sliding_time_hrs_run1": _to_float(_pick("ta_sliding_time_hrs_run1", "ta_sliding_time_hrs")),
-        "ta_sliding_time_hrs_run2": _to_float(data.get("ta_sliding_time_hrs_run2")),
-        "ta_sliding_time_hrs_run3": _to_float(data.get("ta_sliding_time_hrs_run3")),
-        "ta_sliding_meters_run1": _to_float(_pick("ta_sliding_meters_run1", "ta_sliding_meters")),
-        "ta_sliding_meters_run2": _to_float(data.get("ta_sliding_meters_run2")),
-        "ta_sliding_meters_run3": _to_float(data.get("ta_sliding_meters_run3")),
-        "ta_npt_due_to_rig_hrs_run1": _to_float(_pick("ta_npt_due_to_rig_hrs_run1", "ta_npt_due_to_rig_hrs")),
-        "ta_npt_due_to_rig_hrs_run2": _to_float(data.get("ta_npt_due_to_rig_hrs_run2")),
-        "ta_npt_due_to_rig_hrs_run3": _to_float(data.get("ta_npt_due_to_rig_hrs_run3")),
-        "ta_npt_due_to_motor_hrs_run1": _to_float(_pick("ta_npt_due_to_motor_hrs_run1", "ta_npt_due_to_motor_hrs")),
-        "ta_npt_due_to_motor_hrs_run2": _to_float(data.get("ta_npt_due_to_motor_hrs_run2")),
-        "ta_npt_due_to_motor_hrs_run3": _to_float(data.get("ta_npt_due_to_motor_hrs_run3")),
-        "ta_npt_due_to_mwd_hrs_run1": _to_float(_pick("ta_npt_due_to_mwd_hrs_run1", "ta_npt_due_to_mwd_hrs")),
-        "ta_npt_due_to_mwd_hrs_run2": _to_float(data.get("ta_npt_due_to_mwd_hrs_run2")),
-        "ta_npt_due_to_mwd_hrs_run3": _to_float(data.get("ta_npt_due_to_mwd_hrs_run3")),
-        "ta_brt_hrs_run1": _to_float(_pick("ta_brt_hrs_run1", "ta_total_brt_hrs")),
-        "ta_brt_hrs_run2": _to_float(data.get("ta_brt_hrs_run2")),
-        "ta_brt_hrs_run3": _to_float(data.get("ta_brt_hrs_run3")),
-        "ta_release_date": _to_iso_date(data.get("ta_release_date")),
-        "ta_release_time": _txt("ta_release_time"),
+        "bit1_brand": bit1_brand,
+        "bit1_kind": bit1_kind,
+        "bit1_type": bit1_type,
+        "bit1_iadc": bit1_iadc,
+        "bit1_serial": bit1_serial,
+        "bit_brand": bit1_brand,
+        "bit_kind": bit1_kind,
+        "bit_type": bit1_type,
+        "bit_iadc": bit1_iadc,
+        "bit_serial": bit1_serial,
     }
 
-    tickets = []
-    for i in range(1, 4):
-        date_key = f"ticket_date_{i}"
-        price_key = f"ticket_price_usd_{i}"
-        tickets.append(
-            {
-                "line_no": i,
-                "ticket_date": _to_iso_date(data.get(date_key)),
-                "ticket_price_usd": _to_float(data.get(price_key)),
-            }
-        )
+    for col, legacy in _RUN1_LEGACY_KEYS.items():
+        payload[col] = _to_float(_pick(col, legacy))
+    for col in _HOLE_SECTION_COLS:
+        if col not in payload:
+            payload[col] = _COERCERS.get(col, _to_text)(_get(col))
 
-    bit1_nozzles: List[NozzleLine] = list(data.get("bit1_nozzles") or [])
-    bit2_nozzles: List[NozzleLine] = list(data.get("bit2_nozzles") or [])
-
-    with get_connection() as conn:
-        cur = conn.execute(
-            """
-            UPDATE well_hole_section_data
-            SET
-              mud_motor_brand = ?,
-              mud_motor_size = ?,
-              mud_motor_sleeve_stb_gauge_in = ?,
-              mud_motor_bend_angle_deg = ?,
-              mud_motor_lobe = ?,
-              mud_motor_stage = ?,
-              mud_motor_ibs_gauge_in = ?,
-              mud_motor1_brand = ?,
-              mud_motor1_size = ?,
-              mud_motor1_sleeve_stb_gauge_in = ?,
-              mud_motor1_sleeve_none = ?,
-              mud_motor1_bend_angle_deg = ?,
-              mud_motor1_lobe = ?,
-              mud_motor1_stage = ?,
-              mud_motor1_ibs_gauge_in = ?,
-              mud_motor1_ibs_none = ?,
-              mud_motor2_brand = ?,
-              mud_motor2_size = ?,
-              mud_motor2_sleeve_stb_gauge_in = ?,
-              mud_motor2_sleeve_none = ?,
-              mud_motor2_bend_angle_deg = ?,
-              mud_motor2_lobe = ?,
-              mud_motor2_stage = ?,
-              mud_motor2_ibs_gauge_in = ?,
-              mud_motor2_ibs_none = ?,
-              bit_brand = ?,
-              bit_kind = ?,
-              bit_type = ?,
-              bit_iadc = ?,
-              bit_serial = ?,
-              bit1_brand = ?,
-              bit1_kind = ?,
-              bit1_type = ?,
-              bit1_iadc = ?,
-              bit1_serial = ?,
-              bit2_brand = ?,
-              bit2_kind = ?,
-              bit2_type = ?,
-              bit2_iadc = ?,
-              bit2_serial = ?,
-              personnel_day_dd_1 = ?,
-              personnel_day_dd_2 = ?,
-              personnel_day_dd_3 = ?,
-              personnel_night_dd_1 = ?,
-              personnel_night_dd_2 = ?,
-              personnel_night_dd_3 = ?,
-              personnel_day_mwd_1 = ?,
-              personnel_day_mwd_2 = ?,
-              personnel_day_mwd_3 = ?,
-              personnel_night_mwd_1 = ?,
-              personnel_night_mwd_2 = ?,
-              personnel_night_mwd_3 = ?,
-              info_casing_shoe = ?,
-              info_casing_od = ?,
-              info_casing_id = ?,
-              info_section_tvd = ?,
-              info_section_md = ?,
-              info_mud_type = ?,
-              ta_call_out_date = ?,
-              ta_crew_mob_time = ?,
-              ta_standby_time_hrs_run1 = ?,
-              ta_standby_time_hrs_run2 = ?,
-              ta_standby_time_hrs_run3 = ?,
-              ta_ru_time_hrs_run1 = ?,
-              ta_ru_time_hrs_run2 = ?,
-              ta_ru_time_hrs_run3 = ?,
-              ta_tripping_time_hrs_run1 = ?,
-              ta_tripping_time_hrs_run2 = ?,
-              ta_tripping_time_hrs_run3 = ?,
-              ta_circulation_time_hrs_run1 = ?,
-              ta_circulation_time_hrs_run2 = ?,
-              ta_circulation_time_hrs_run3 = ?,
-              ta_rotary_time_hrs_run1 = ?,
-              ta_rotary_time_hrs_run2 = ?,
-              ta_rotary_time_hrs_run3 = ?,
-              ta_rotary_meters_run1 = ?,
-              ta_rotary_meters_run2 = ?,
-              ta_rotary_meters_run3 = ?,
-              ta_sliding_time_hrs_run1 = ?,
-              ta_sliding_time_hrs_run2 = ?,
-              ta_sliding_time_hrs_run3 = ?,
-              ta_sliding_meters_run1 = ?,
-              ta_sliding_meters_run2 = ?,
-              ta_sliding_meters_run3 = ?,
-              ta_npt_due_to_rig_hrs_run1 = ?,
-              ta_npt_due_to_rig_hrs_run2 = ?,
-              ta_npt_due_to_rig_hrs_run3 = ?,
-              ta_npt_due_to_motor_hrs_run1 = ?,
-              ta_npt_due_to_motor_hrs_run2 = ?,
-              ta_npt_due_to_motor_hrs_run3 = ?,
-              ta_npt_due_to_mwd_hrs_run1 = ?,
-              ta_npt_due_to_mwd_hrs_run2 = ?,
-              ta_npt_due_to_mwd_hrs_run3 = ?,
-              ta_brt_hrs_run1 = ?,
-              ta_brt_hrs_run2 = ?,
-              ta_brt_hrs_run3 = ?,
-              ta_release_date = ?,
-              ta_release_time = ?,
-              updated_at = ?
-            WHERE well_id = ? AND hole_key = ?
-            """,
-            (
-                payload["mud_motor_brand"],
-                payload["mud_motor_size"],
-                payload["mud_motor_sleeve_stb_gauge_in"],
-                payload["mud_motor_bend_angle_deg"],
-                payload["mud_motor_lobe"],
-                payload["mud_motor_stage"],
-                payload["mud_motor_ibs_gauge_in"],
-                payload["mud_motor1_brand"],
-                payload["mud_motor1_size"],
-                payload["mud_motor1_sleeve_stb_gauge_in"],
-                payload["mud_motor1_sleeve_none"],
-                payload["mud_motor1_bend_angle_deg"],
-                payload["mud_motor1_lobe"],
-                payload["mud_motor1_stage"],
-                payload["mud_motor1_ibs_gauge_in"],
-                payload["mud_motor1_ibs_none"],
-                payload["mud_motor2_brand"],
-                payload["mud_motor2_size"],
-                payload["mud_motor2_sleeve_stb_gauge_in"],
-                payload["mud_motor2_sleeve_none"],
-                payload["mud_motor2_bend_angle_deg"],
-                payload["mud_motor2_lobe"],
-                payload["mud_motor2_stage"],
-                payload["mud_motor2_ibs_gauge_in"],
-                payload["mud_motor2_ibs_none"],
-                payload["bit_brand"],
-                payload["bit_kind"],
-                payload["bit_type"],
-                payload["bit_iadc"],
-                payload["bit_serial"],
-                payload["bit1_brand"],
-                payload["bit1_kind"],
-                payload["bit1_type"],
-                payload["bit1_iadc"],
-                payload["bit1_serial"],
-                payload["bit2_brand"],
-                payload["bit2_kind"],
-                payload["bit2_type"],
-                payload["bit2_iadc"],
-                payload["bit2_serial"],
-                payload["personnel_day_dd_1"],
-                payload["personnel_day_dd_2"],
-                payload["personnel_day_dd_3"],
-                payload["personnel_night_dd_1"],
-                payload["personnel_night_dd_2"],
-                payload["personnel_night_dd_3"],
-                payload["personnel_day_mwd_1"],
-                payload["personnel_day_mwd_2"],
-                payload["personnel_day_mwd_3"],
-                payload["personnel_night_mwd_1"],
-                payload["personnel_night_mwd_2"],
-                payload["personnel_night_mwd_3"],
-                payload["info_casing_shoe"],
-                payload["info_casing_od"],
-                payload["info_casing_id"],
-                payload["info_section_tvd"],
-                payload["info_section_md"],
-                payload["info_mud_type"],
-                payload["ta_call_out_date"],
-                payload["ta_crew_mob_time"],
-                payload["ta_standby_time_hrs_run1"],
-                payload["ta_standby_time_hrs_run2"],
-                payload["ta_standby_time_hrs_run3"],
-                payload["ta_ru_time_hrs_run1"],
-                payload["ta_ru_time_hrs_run2"],
-                payload["ta_ru_time_hrs_run3"],
-                payload["ta_tripping_time_hrs_run1"],
-                payload["ta_tripping_time_hrs_run2"],
-                payload["ta_tripping_time_hrs_run3"],
-                payload["ta_circulation_time_hrs_run1"],
-                payload["ta_circulation_time_hrs_run2"],
-                payload["ta_circulation_time_hrs_run3"],
-                payload["ta_rotary_time_hrs_run1"],
-                payload["ta_rotary_time_hrs_run2"],
-                payload["ta_rotary_time_hrs_run3"],
-                payload["ta_rotary_meters_run1"],
-                payload["ta_rotary_meters_run2"],
-                payload["ta_rotary_meters_run3"],
-                payload["ta_sliding_time_hrs_run1"],
-                payload["ta_sliding_time_hrs_run2"],
-                payload["ta_sliding_time_hrs_run3"],
-                payload["ta_sliding_meters_run1"],
-                payload["ta_sliding_meters_run2"],
-                payload["ta_sliding_meters_run3"],
-                payload["ta_npt_due_to_rig_hrs_run1"],
-                payload["ta_npt_due_to_rig_hrs_run2"],
-                payload["ta_npt_due_to_rig_hrs_run3"],
-                payload["ta_npt_due_to_motor_hrs_run1"],
-                payload["ta_npt_due_to_motor_hrs_run2"],
-                payload["ta_npt_due_to_motor_hrs_run3"],
-                payload["ta_npt_due_to_mwd_hrs_run1"],
-                payload["ta_npt_due_to_mwd_hrs_run2"],
-                payload["ta_npt_due_to_mwd_hrs_run3"],
-                payload["ta_brt_hrs_run1"],
-                payload["ta_brt_hrs_run2"],
-                payload["ta_brt_hrs_run3"],
-                payload["ta_release_date"],
-                payload["ta_release_time"],
-                now,
-                wid,
-                hkey,
-            ),
-        )
-
-        if cur.rowcount == 0:
-            conn.execute(
-                """
-                INSERT INTO well_hole_section_data (
-                  well_id,
-                  hole_key,
-                  mud_motor_brand,
-                  mud_motor_size,
-                  mud_motor_sleeve_stb_gauge_in,
-                  mud_motor_bend_angle_deg,
-                  mud_motor_lobe,
-                  mud_motor_stage,
-                  mud_motor_ibs_gauge_in,
-                  mud_motor1_brand,
-                  mud_motor1_size,
-                  mud_motor1_sleeve_stb_gauge_in,
-                  mud_motor1_sleeve_none,
-                  mud_motor1_bend_angle_deg,
-                  mud_motor1_lobe,
-                  mud_motor1_stage,
-                  mud_motor1_ibs_gauge_in,
-                  mud_motor1_ibs_none,
-                  mud_motor2_brand,
-                  mud_motor2_size,
-                  mud_motor2_sleeve_stb_gauge_in,
-                  mud_motor2_sleeve_none,
-                  mud_motor2_bend_angle_deg,
-                  mud_motor2_lobe,
-                  mud_motor2_stage,
-                  mud_motor2_ibs_gauge_in,
-                  mud_motor2_ibs_none,
-                  bit_brand,
-                  bit_kind,
-                  bit_type,
-                  bit_iadc,
-                  bit_serial,
-                  bit1_brand,
-                  bit1_kind,
-                  bit1_type,
-                  bit1_iadc,
-                  bit1_serial,
-                  bit2_brand,
-                  bit2_kind,
-                  bit2_type,
-                  bit2_iadc,
-                  bit2_serial,
-                  personnel_day_dd_1,
-                  personnel_day_dd_2,
-                  personnel_day_dd_3,
-                  personnel_night_dd_1,
-                  personnel_night_dd_2,
-                  personnel_night_dd_3,
-                  personnel_day_mwd_1,
-                  personnel_day_mwd_2,
-                  personnel_day_mwd_3,
-                  personnel_night_mwd_1,
-                  personnel_night_mwd_2,
-                  personnel_night_mwd_3,
-                  info_casing_shoe,
-                  info_casing_od,
-                  info_casing_id,
-                  info_section_tvd,
-                  info_section_md,
-                  info_mud_type,
-                  ta_call_out_date,
-                  ta_crew_mob_time,
-                  ta_standby_time_hrs_run1,
-                  ta_standby_time_hrs_run2,
-                  ta_standby_time_hrs_run3,
-                  ta_ru_time_hrs_run1,
-                  ta_ru_time_hrs_run2,
-                  ta_ru_time_hrs_run3,
-                  ta_tripping_time_hrs_run1,
-                  ta_tripping_time_hrs_run2,
-                  ta_tripping_time_hrs_run3,
-                  ta_circulation_time_hrs_run1,
-                  ta_circulation_time_hrs_run2,
-                  ta_circulation_time_hrs_run3,
-                  ta_rotary_time_hrs_run1,
-                  ta_rotary_time_hrs_run2,
-                  ta_rotary_time_hrs_run3,
-                  ta_rotary_meters_run1,
-                  ta_rotary_meters_run2,
-                  ta_rotary_meters_run3,
-                  ta_sliding_time_hrs_run1,
-                  ta_sliding_time_hrs_run2,
-                  ta_sliding_time_hrs_run3,
-                  ta_sliding_meters_run1,
-                  ta_sliding_meters_run2,
-                  ta_sliding_meters_run3,
-                  ta_npt_due_to_rig_hrs_run1,
-                  ta_npt_due_to_rig_hrs_run2,
-                  ta_npt_due_to_rig_hrs_run3,
-                  ta_npt_due_to_motor_hrs_run1,
-                  ta_npt_due_to_motor_hrs_run2,
-                  ta_npt_due_to_motor_hrs_run3,
-                  ta_npt_due_to_mwd_hrs_run1,
-                  ta_npt_due_to_mwd_hrs_run2,
-                  ta_npt_due_to_mwd_hrs_run3,
-                  ta_brt_hrs_run1,
-                  ta_brt_hrs_run2,
-                  ta_brt_hrs_run3,
-                  ta_release_date,
-                  ta_release_time,
-                  updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    wid,
-                    hkey,
-                    payload["mud_motor_brand"],
-                    payload["mud_motor_size"],
-                    payload["mud_motor_sleeve_stb_gauge_in"],
-                    payload["mud_motor_bend_angle_deg"],
-                    payload["mud_motor_lobe"],
-                    payload["mud_motor_stage"],
-                    payload["mud_motor_ibs_gauge_in"],
-                    payload["mud_motor1_brand"],
-                    payload["mud_motor1_size"],
-                    payload["mud_motor1_sleeve_stb_gauge_in"],
-                    payload["mud_motor1_sleeve_none"],
-                    payload["mud_motor1_bend_angle_deg"],
-                    payload["mud_motor1_lobe"],
-                    payload["mud_motor1_stage"],
-                    payload["mud_motor1_ibs_gauge_in"],
-                    payload["mud_motor1_ibs_none"],
-                    payload["mud_motor2_brand"],
-                    payload["mud_motor2_size"],
-                    payload["mud_motor2_sleeve_stb_gauge_in"],
-                    payload["mud_motor2_sleeve_none"],
-                    payload["mud_motor2_bend_angle_deg"],
-                    payload["mud_motor2_lobe"],
-                    payload["mud_motor2_stage"],
-                    payload["mud_motor2_ibs_gauge_in"],
-                    payload["mud_motor2_ibs_none"],
-                    payload["bit_brand"],
-                    payload["bit_kind"],
-                    payload["bit_type"],
-                    payload["bit_iadc"],
-                    payload["bit_serial"],
-                    payload["bit1_brand"],
-                    payload["bit1_kind"],
-                    payload["bit1_type"],
-                    payload["bit1_iadc"],
-                    payload["bit1_serial"],
-                    payload["bit2_brand"],
-                    payload["bit2_kind"],
-                    payload["bit2_type"],
-                    payload["bit2_iadc"],
-                    payload["bit2_serial"],
-                    payload["personnel_day_dd_1"],
-                    payload["personnel_day_dd_2"],
-                    payload["personnel_day_dd_3"],
-                    payload["personnel_night_dd_1"],
-                    payload["personnel_night_dd_2"],
-                    payload["personnel_night_dd_3"],
-                    payload["personnel_day_mwd_1"],
-                    payload["personnel_day_mwd_2"],
-                    payload["personnel_day_mwd_3"],
-                    payload["personnel_night_mwd_1"],
-                    payload["personnel_night_mwd_2"],
-                    payload["personnel_night_mwd_3"],
-                    payload["info_casing_shoe"],
-                    payload["info_casing_od"],
-                    payload["info_casing_id"],
-                    payload["info_section_tvd"],
-                    payload["info_section_md"],
-                    payload["info_mud_type"],
-                    payload["ta_call_out_date"],
-                    payload["ta_crew_mob_time"],
-                    payload["ta_standby_time_hrs_run1"],
-                    payload["ta_standby_time_hrs_run2"],
-                    payload["ta_standby_time_hrs_run3"],
-                    payload["ta_ru_time_hrs_run1"],
-                    payload["ta_ru_time_hrs_run2"],
-                    payload["ta_ru_time_hrs_run3"],
-                    payload["ta_tripping_time_hrs_run1"],
-                    payload["ta_tripping_time_hrs_run2"],
-                    payload["ta_tripping_time_hrs_run3"],
-                    payload["ta_circulation_time_hrs_run1"],
-                    payload["ta_circulation_time_hrs_run2"],
-                    payload["ta_circulation_time_hrs_run3"],
-                    payload["ta_rotary_time_hrs_run1"],
-                    payload["ta_rotary_time_hrs_run2"],
-                    payload["ta_rotary_time_hrs_run3"],
-                    payload["ta_rotary_meters_run1"],
-                    payload["ta_rotary_meters_run2"],
-                    payload["ta_rotary_meters_run3"],
-                    payload["ta_sliding_time_hrs_run1"],
-                    payload["ta_sliding_time_hrs_run2"],
-                    payload["ta_sliding_time_hrs_run3"],
-                    payload["ta_sliding_meters_run1"],
-                    payload["ta_sliding_meters_run2"],
-                    payload["ta_sliding_meters_run3"],
-                    payload["ta_npt_due_to_rig_hrs_run1"],
-                    payload["ta_npt_due_to_rig_hrs_run2"],
-                    payload["ta_npt_due_to_rig_hrs_run3"],
-                    payload["ta_npt_due_to_motor_hrs_run1"],
-                    payload["ta_npt_due_to_motor_hrs_run2"],
-                    payload["ta_npt_due_to_motor_hrs_run3"],
-                    payload["ta_npt_due_to_mwd_hrs_run1"],
-                    payload["ta_npt_due_to_mwd_hrs_run2"],
-                    payload["ta_npt_due_to_mwd_hrs_run3"],
-                    payload["ta_brt_hrs_run1"],
-                    payload["ta_brt_hrs_run2"],
-                    payload["ta_brt_hrs_run3"],
-                    payload["ta_release_date"],
-                    payload["ta_release_time"],
-                    now,
+    # only lines with a date or a price are stored; blank lines are removed
+    ticket_rows = []
+    blank_ticket_lines = []
+    for i in range(1, 4):
+        ticket_date = _to_iso_date(_get(f"ticket_date_{i}"))
+        ticket_price = _to_float(_get(f"ticket_price_usd_{i}"))
+        if ticket_date is None and ticket_price is None:
+            blank_ticket_lines.append((wid, hkey, i))
+        else:
+            ticket_rows.append((wid, hkey, i, ticket_date, ticket_price, now))
+
+    bit1_nozzles: Sequence[NozzleLine] = _get("bit1_nozzles") or ()
+    bit2_nozzles: Sequence[NozzleLine] = _get("bit2_nozzles") or ()
+
+    section_params = (wid, hkey) + tuple(payload[c] for c in _HOLE_SECTION_COLS) + (now,)
+
+    # one BEGIN IMMEDIATE ... COMMIT (one WAL commit) for the section and its lines;
+    # only bound statements run while the write lock is held
+    conn = get_connection()
+    with transaction(conn):
+        conn.execute(_SQL_UPSERT_HOLE_SECTION, section_params)
+
+        if ticket_rows:
+            conn.executemany(_SQL_INSERT_TICKET, ticket_rows)
+        if blank_ticket_lines:
+            conn.executemany(_SQL_DELETE_TICKET_LINE, blank_ticket_lines)
+
+        if bit1_nozzles or bit2_nozzles:
+            conn.executemany(
+                _SQL_INSERT_NOZZLE,
+                chain(
+                    ((wid, hkey, 1, i + 1, n.count, n.size_32nds, now) for i, n in enumerate(bit1_nozzles)),
+                    ((wid, hkey, 2, i + 1, n.count, n.size_32nds, now) for i, n in enumerate(bit2_nozzles)),
                 ),
             )
-
-        conn.execute(
-            "DELETE FROM well_hse_ticket WHERE well_id = ? AND hole_key = ?",
-            (wid, hkey),
-        )
-        conn.execute(
-            "DELETE FROM well_hse_nozzle WHERE well_id = ? AND hole_key = ?",
-            (wid, hkey),
-        )
-
         conn.executemany(
-            """
-            INSERT INTO well_hse_ticket (well_id, hole_key, line_no, ticket_date, ticket_price_usd, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            [
-                (wid, hkey, t["line_no"], t["ticket_date"], t["ticket_price_usd"], now)
-                for t in tickets
-            ],
+            _SQL_TRIM_NOZZLES,
+            (
+                (wid, hkey, 1, len(bit1_nozzles)),
+                (wid, hkey, 2, len(bit2_nozzles)),
+            ),
         )
 
-        conn.executemany(
-            """
-            INSERT INTO well_hse_nozzle (well_id, hole_key, bit_index, line_no, count, size_32nds, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                (wid, hkey, 1, i + 1, n.count, n.size_32nds, now)
-                for i, n in enumerate(bit1_nozzles)
-            ]
-            + [
-                (wid, hkey, 2, i + 1, n.count, n.size_32nds, now)
-                for i, n in enumerate(bit2_nozzles)
-            ],
-        )
+    _cache.pop((wid, hkey), None)
 
 
 def delete_hole_section(well_id: str, hole_key: str) -> None:
-    wid = (well_id or "").strip()
-    hkey = (hole_key or "").strip()
+    wid = clean_key(well_id)
+    hkey = clean_key(hole_key)
     if not wid or not hkey:
         return
 
-    with get_connection() as conn:
-        conn.execute(
-            "DELETE FROM well_hse_nozzle WHERE well_id = ? AND hole_key = ?",
-            (wid, hkey),
-        )
-        conn.execute(
-            "DELETE FROM well_hse_ticket WHERE well_id = ? AND hole_key = ?",
-            (wid, hkey),
-        )
-        conn.execute(
-            "DELETE FROM well_hole_section_data WHERE well_id = ? AND hole_key = ?",
-            (wid, hkey),
-        )
+    # ticket and nozzle lines go with the section (ON DELETE CASCADE)
+    conn = get_connection()
+    conn.execute(
+        _SQL_DELETE_HOLE_SECTION,
+        (wid, hkey),
+    )
+
+    _cache.pop((wid, hkey), None)
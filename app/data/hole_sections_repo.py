@@ -1,51 +1,69 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 from typing import Iterable, Set
 
-from app.data.db import get_connection
+from app.data._validate import clean_key, require_well
+from app.data.db import get_connection, transaction
 
 
 def iso_now() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+_SQL_SELECT_ENABLED_HOLE_SIZES = """
+    SELECT node_key
+    FROM well_hole_sections
+    WHERE well_id = ? AND is_enabled = 1
+"""
+
+# Removes rows whose node_key is not in the JSON array bound as the second
+# parameter; the statement text stays fixed whatever the set size.
+_SQL_DELETE_HOLE_SIZES_NOT_IN = """
+    DELETE FROM well_hole_sections
+    WHERE well_id = ? AND node_key NOT IN (SELECT value FROM json_each(?))
+"""
+
+# Existing enabled rows are left untouched; only new or re-enabled keys write.
+_SQL_UPSERT_HOLE_SIZE = """
+    INSERT INTO well_hole_sections (well_id, node_key, is_enabled, updated_at)
+    VALUES (?, ?, 1, ?)
+    ON CONFLICT (well_id, node_key) DO UPDATE SET
+      is_enabled = 1,
+      updated_at = excluded.updated_at
+    WHERE is_enabled <> 1
+"""
+
+
 def get_enabled_hole_sizes(well_id: str) -> Set[str]:
-    wid = (well_id or "").strip()
+    wid = clean_key(well_id)
     if not wid:
         return set()
 
-    with get_connection() as conn:
-        rows = conn.execute(
-            """
-            SELECT node_key
-            FROM well_hole_sections
-            WHERE well_id = ? AND is_enabled = 1
-            """,
-            (wid,),
-        ).fetchall()
+    conn = get_connection()
+    rows = conn.execute(
+        _SQL_SELECT_ENABLED_HOLE_SIZES,
+        (wid,),
+    ).fetchall()
 
     return {str(r["node_key"]) for r in rows}
 
 
 def save_enabled_hole_sizes(well_id: str, enabled_set: Iterable[str]) -> None:
-    wid = (well_id or "").strip()
-    if not wid:
-        raise ValueError("well_id is required")
+    wid = require_well(well_id)
 
     now = iso_now()
     enabled = {str(k) for k in enabled_set if str(k).strip()}
 
-    with get_connection() as conn:
+    conn = get_connection()
+    with transaction(conn):
         conn.execute(
-            "DELETE FROM well_hole_sections WHERE well_id = ?",
-            (wid,),
+            _SQL_DELETE_HOLE_SIZES_NOT_IN,
+            (wid, json.dumps(list(enabled))),
         )
         if enabled:
             conn.executemany(
-                """
-                INSERT INTO well_hole_sections (well_id, node_key, is_enabled, updated_at)
-                VALUES (?, ?, 1, ?)
-                """,
-                [(wid, node_key, now) for node_key in sorted(enabled)],
+                _SQL_UPSERT_HOLE_SIZE,
+                [(wid, node_key, now) for node_key in enabled],
             )
@@ -50,7 +50,7 @@ CREATE TABLE IF NOT EXISTS well_identity (
   notes TEXT NULL,
   updated_at TEXT NOT NULL,
 
-  FOREIGN KEY (well_id) REFERENCES wells(well_id)
+  FOREIGN KEY (well_id) REFERENCES wells(well_id) ON DELETE CASCADE
 );
 
 -- ----------------------------
@@ -79,7 +79,7 @@ CREATE TABLE IF NOT EXISTS well_trajectory (
   created_at TEXT NOT NULL,
   updated_at TEXT NOT NULL,
 
-  FOREIGN KEY (well_id) REFERENCES wells(well_id)
+  FOREIGN KEY (well_id) REFERENCES wells(well_id) ON DELETE CASCADE
 );
 
 
@@ -105,7 +105,7 @@ CREATE TABLE IF NOT EXISTS well_section_nodes (
   created_at TEXT NOT NULL,
   updated_at TEXT NOT NULL,
 
-  FOREIGN KEY (well_id) REFERENCES wells(well_id)
+  FOREIGN KEY (well_id) REFERENCES wells(well_id) ON DELETE CASCADE
 );
 
 CREATE INDEX IF NOT EXISTS idx_nodes_well
@@ -117,6 +117,12 @@ CREATE INDEX IF NOT EXISTS idx_nodes_parent
 CREATE UNIQUE INDEX IF NOT EXISTS uq_nodes_well_nodekey
   ON well_section_nodes(well_id, node_key);
 
+-- get_selected_sections: seek on the filter columns and walk order_index in
+-- index order (no sort). node_key is left out on purpose: equal order_index
+-- values must keep falling back to rowid (template) order.
+CREATE INDEX IF NOT EXISTS idx_nodes_selected_sections
+  ON well_section_nodes(well_id, node_type, is_enabled, is_selected, order_index);
+
 -- ----------------------------
 -- Hole Section Enablement
 -- ----------------------------
@@ -127,9 +133,15 @@ CREATE TABLE IF NOT EXISTS well_hole_sections (
   updated_at TEXT NOT NULL,
 
   PRIMARY KEY (well_id, node_key),
-  FOREIGN KEY (well_id) REFERENCES wells(well_id)
+  FOREIGN KEY (well_id) REFERENCES wells(well_id) ON DELETE CASCADE
 );
 
+-- get_enabled_hole_sizes reads only enabled rows. is_enabled is carried in the
+-- index so the lookup never touches the table. Section data, ticket and nozzle
+-- lookups by (well_id, hole_key) are served by their primary keys.
+CREATE INDEX IF NOT EXISTS idx_hole_sections_enabled
+  ON well_hole_sections(well_id, node_key, is_enabled) WHERE is_enabled = 1;
+
 
 -- ----------------------------
 -- Hole Section Data
@@ -244,7 +256,7 @@ CREATE TABLE IF NOT EXISTS well_hole_section_data (
   updated_at TEXT NOT NULL,
 
   PRIMARY KEY (well_id, hole_key),
-  FOREIGN KEY (well_id) REFERENCES wells(well_id)
+  FOREIGN KEY (well_id) REFERENCES wells(well_id) ON DELETE CASCADE
 );
 
 CREATE INDEX IF NOT EXISTS idx_hse_data_well
@@ -259,7 +271,9 @@ CREATE TABLE IF NOT EXISTS well_hse_ticket (
   updated_at TEXT NOT NULL,
 
   PRIMARY KEY (well_id, hole_key, line_no),
-  FOREIGN KEY (well_id) REFERENCES wells(well_id)
+  FOREIGN KEY (well_id) REFERENCES wells(well_id) ON DELETE CASCADE,
+  FOREIGN KEY (well_id, hole_key)
+    REFERENCES well_hole_section_data(well_id, hole_key) ON DELETE CASCADE
 );
 
 CREATE TABLE IF NOT EXISTS well_hse_nozzle (
@@ -272,7 +286,9 @@ CREATE TABLE IF NOT EXISTS well_hse_nozzle (
   updated_at TEXT NOT NULL,
 
   PRIMARY KEY (well_id, hole_key, bit_index, line_no),
-  FOREIGN KEY (well_id) REFERENCES wells(well_id)
+  FOREIGN KEY (well_id) REFERENCES wells(well_id) ON DELETE CASCADE,
+  FOREIGN KEY (well_id, hole_key)
+    REFERENCES well_hole_section_data(well_id, hole_key) ON DELETE CASCADE
 );
 
 -- ----------------------------
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, TypedDict
 
-from app.data.db import get_connection
+from app.data.db import get_connection, transaction
 from app.sections import builder
 
 
@@ -18,74 +18,70 @@ class NodeFlags(TypedDict, total=False):
     is_completed: bool
 
 
+_SQL_SELECT_NODE_FLAGS = """
+    SELECT node_key, title, node_type, parent_id, order_index,
+           is_enabled, is_selected, is_completed
+    FROM well_section_nodes
+    WHERE well_id = ? AND node_key = ?
+"""
+
+_SQL_IS_SECTION_SELECTED = """
+    SELECT 1
+    FROM well_section_nodes
+    WHERE well_id = ? AND node_key = ?
+      AND node_type = 'SECTION' AND is_enabled = 1 AND is_selected = 1
+"""
+
+
 def ensure_section_tree(well_id: str, step1_context: Dict[str, Any]) -> None:
     """
     Builds/materializes the per-well section tree in DB using builder.ensure_section_tree().
     Must be called AFTER Step1 is validated & saved (needs well_type etc).
     """
     conn = get_connection()
-    try:
+    with transaction(conn):
         builder.ensure_section_tree(conn, str(well_id), step1_context)
-    finally:
-        conn.close()
 
 
 def set_section_selected(well_id: str, node_key: str, selected: bool) -> None:
     """Persists selection for a SECTION node."""
-    conn = get_connection()
-    try:
-        builder.set_section_selected(conn, str(well_id), str(node_key), bool(selected))
-    finally:
-        conn.close()
+    builder.set_section_selected(get_connection(), str(well_id), str(node_key), bool(selected))
 
 
 def get_selected_sections(well_id: str) -> List[str]:
     """Returns selected + enabled SECTION node_keys ordered by order_index."""
-    conn = get_connection()
-    try:
-        return builder.get_selected_sections(conn, str(well_id))
-    finally:
-        conn.close()
+    return builder.get_selected_sections(get_connection(), str(well_id))
 
 
 def get_node_flags(well_id: str, node_key: str) -> Optional[NodeFlags]:
     """
     Reads node flags directly from DB. Useful for router decisions.
     """
-    conn = get_connection()
-    try:
-        row = conn.execute(
-            """
-            SELECT node_key, title, node_type, parent_id, order_index,
-                   is_enabled, is_selected, is_completed
-            FROM well_section_nodes
-            WHERE well_id = ? AND node_key = ?
-            """,
-            (str(well_id), str(node_key)),
-        ).fetchone()
-
-        if not row:
-            return None
-
-        return NodeFlags(
-            node_key=row["node_key"],
-            title=row["title"],
-            node_type=row["node_type"],
-            parent_id=row["parent_id"],
-            order_index=int(row["order_index"]),
-            is_enabled=bool(row["is_enabled"]),
-            is_selected=bool(row["is_selected"]),
-            is_completed=bool(row["is_completed"]),
-        )
-    finally:
-        conn.close()
+    row = get_connection().execute(
+        _SQL_SELECT_NODE_FLAGS,
+        (str(well_id), str(node_key)),
+    ).fetchone()
+
+    if not row:
+        return None
+
+    nk, title, node_type, parent_id, order_index, is_enabled, is_selected, is_completed = row
+    return NodeFlags(
+        node_key=nk,
+        title=title,
+        node_type=node_type,
+        parent_id=parent_id,
+        order_index=int(order_index),
+        is_enabled=bool(is_enabled),
+        is_selected=bool(is_selected),
+        is_completed=bool(is_completed),
+    )
 
 
 def is_section_selected(well_id: str, node_key: str) -> bool:
     """True if node exists and is_enabled=1 and is_selected=1 for SECTION nodes."""
-    flags = get_node_flags(well_id, node_key)
-    if not flags:
-        return False
-    if flags.get("node_type") != "SECTION":
-        return False
-    return bool(flags.get("is_enabled", False) and flags.get("is_selected", False))
\ No newline at end of file
+    row = get_connection().execute(
+        _SQL_IS_SECTION_SELECTED,
+        (str(well_id), str(node_key)),
+    ).fetchone()
+    return row is not None
@@ -3,7 +3,8 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-from app.data.db import get_connection
+from app.data._validate import clean_key, require_well
+from app.data.db import get_connection, transaction
 
 
 def iso_now() -> str:
@@ -13,155 +14,97 @@ def iso_now() -> str:
 def _to_float(value: Any) -> Optional[float]:
     if value is None:
         return None
-    s = str(value).strip()
-    if s == "":
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    s = value.strip() if isinstance(value, str) else str(value).strip()
+    if not s:
         return None
-    return float(s)
+    if "," in s:
+        s = s.replace(",", ".")
+    try:
+        return float(s)
+    except ValueError:
+        return None
+
+
+_TRAJECTORY_COLS = (
+    "kop_m",
+    "tvd_planned_m",
+    "md_planned_m",
+    "max_inc_planned_deg",
+    "azimuth_planned_deg",
+    "max_dls_planned_deg_per_30m",
+    "vs_planned_m",
+    "dist_planned_m",
+    "tvd_at_td_m",
+    "md_at_td_m",
+    "inc_at_td_deg",
+    "azimuth_at_td_deg",
+    "max_dls_actual_deg_per_30m",
+    "vs_at_td_m",
+    "dist_at_td_m",
+)
+
+# created_at is only written on the first insert; a conflict keeps the original.
+_SQL_UPSERT_TRAJECTORY = (
+    "INSERT INTO well_trajectory (well_id, "
+    + ", ".join(_TRAJECTORY_COLS)
+    + ", created_at, updated_at) VALUES (?, "
+    + ", ".join("?" * len(_TRAJECTORY_COLS))
+    + ", ?, ?) ON CONFLICT (well_id) DO UPDATE SET "
+    + ", ".join(f"{c} = excluded.{c}" for c in _TRAJECTORY_COLS)
+    + ", updated_at = excluded.updated_at"
+)
+
+_SQL_MARK_STEP2_DONE = """
+    UPDATE wells
+    SET step2_done = 1, updated_at = ?
+    WHERE well_id = ?
+"""
+
+_SQL_SELECT_TRAJECTORY = """
+    SELECT *
+    FROM well_trajectory
+    WHERE well_id = ?
+"""
 
 
 def save_trajectory(well_id: str, data: Dict[str, Any]) -> None:
     """
     Inserts or updates well trajectory data for Step 2.
     """
-    wid = (well_id or "").strip()
-    if not wid:
-        raise ValueError("well_id is required")
+    wid = require_well(well_id)
 
     now = iso_now()
 
-    kop_m = _to_float(data.get("kop_m"))
-    tvd_planned_m = _to_float(data.get("tvd_planned_m"))
-    md_planned_m = _to_float(data.get("md_planned_m"))
-    max_inc_planned_deg = _to_float(data.get("max_inc_planned_deg"))
-    azimuth_planned_deg = _to_float(data.get("azimuth_planned_deg"))
-    max_dls_planned_deg_per_30m = _to_float(data.get("max_dls_planned_deg_per_30m"))
-    vs_planned_m = _to_float(data.get("vs_planned_m"))
-    dist_planned_m = _to_float(data.get("dist_planned_m"))
-
-    tvd_at_td_m = _to_float(data.get("tvd_at_td_m"))
-    md_at_td_m = _to_float(data.get("md_at_td_m"))
-    inc_at_td_deg = _to_float(data.get("inc_at_td_deg"))
-    azimuth_at_td_deg = _to_float(data.get("azimuth_at_td_deg"))
-    max_dls_actual_deg_per_30m = _to_float(data.get("max_dls_actual_deg_per_30m"))
-    vs_at_td_m = _to_float(data.get("vs_at_td_m"))
-    dist_at_td_m = _to_float(data.get("dist_at_td_m"))
-
-    with get_connection() as conn:
-        cur = conn.execute(
-            """
-            UPDATE well_trajectory
-            SET
-              kop_m = ?,
-              tvd_planned_m = ?,
-              md_planned_m = ?,
-              max_inc_planned_deg = ?,
-              azimuth_planned_deg = ?,
-              max_dls_planned_deg_per_30m = ?,
-              vs_planned_m = ?,
-              dist_planned_m = ?,
-              tvd_at_td_m = ?,
-              md_at_td_m = ?,
-              inc_at_td_deg = ?,
-              azimuth_at_td_deg = ?,
-              max_dls_actual_deg_per_30m = ?,
-              vs_at_td_m = ?,
-              dist_at_td_m = ?,
-              updated_at = ?
-            WHERE well_id = ?
-            """,
-            (
-                kop_m,
-                tvd_planned_m,
-                md_planned_m,
-                max_inc_planned_deg,
-                azimuth_planned_deg,
-                max_dls_planned_deg_per_30m,
-                vs_planned_m,
-                dist_planned_m,
-                tvd_at_td_m,
-                md_at_td_m,
-                inc_at_td_deg,
-                azimuth_at_td_deg,
-                max_dls_actual_deg_per_30m,
-                vs_at_td_m,
-                dist_at_td_m,
-                now,
-                wid,
-            ),
-        )
+    params = tuple(_to_float(data.get(c)) for c in _TRAJECTORY_COLS)
 
-        if cur.rowcount == 0:
-            conn.execute(
-                """
-                INSERT INTO well_trajectory (
-                  well_id,
-                  kop_m,
-                  tvd_planned_m,
-                  md_planned_m,
-                  max_inc_planned_deg,
-                  azimuth_planned_deg,
-                  max_dls_planned_deg_per_30m,
-                  vs_planned_m,
-                  dist_planned_m,
-                  tvd_at_td_m,
-                  md_at_td_m,
-                  inc_at_td_deg,
-                  azimuth_at_td_deg,
-                  max_dls_actual_deg_per_30m,
-                  vs_at_td_m,
-                  dist_at_td_m,
-                  created_at,
-                  updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    wid,
-                    kop_m,
-                    tvd_planned_m,
-                    md_planned_m,
-                    max_inc_planned_deg,
-                    azimuth_planned_deg,
-                    max_dls_planned_deg_per_30m,
-                    vs_planned_m,
-                    dist_planned_m,
-                    tvd_at_td_m,
-                    md_at_td_m,
-                    inc_at_td_deg,
-                    azimuth_at_td_deg,
-                    max_dls_actual_deg_per_30m,
-                    vs_at_td_m,
-                    dist_at_td_m,
-                    now,
-                    now,
-                ),
-            )
+    conn = get_connection()
+    with transaction(conn):
+        conn.execute(
+            _SQL_UPSERT_TRAJECTORY,
+            (wid,) + params + (now, now),
+        )
 
         conn.execute(
-            """
-            UPDATE wells
-            SET step2_done = 1, updated_at = ?
-            WHERE well_id = ?
-            """,
+            _SQL_MARK_STEP2_DONE,
             (now, wid),
         )
 
 
 def get_trajectory(well_id: str) -> Optional[Dict[str, Any]]:
-    wid = (well_id or "").strip()
+    wid = clean_key(well_id)
     if not wid:
         return None
 
-    with get_connection() as conn:
-        row = conn.execute(
-            """
-            SELECT *
-            FROM well_trajectory
-            WHERE well_id = ?
-            """,
-            (wid,),
-        ).fetchone()
+    conn = get_connection()
+    cur = conn.execute(
+        _SQL_SELECT_TRAJECTORY,
+        (wid,),
+    )
+    row = cur.fetchone()
 
     if not row:
         return None
 
-    return {k: row[k] for k in row.keys()}
+    return dict(zip([d[0] for d in cur.description], row))
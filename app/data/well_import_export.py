@@ -1,28 +1,108 @@
 # app/data/well_import_export.py
 from __future__ import annotations
 
+import re
 import sqlite3
+import time
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
-
-from app.data.db import DB_PATH, SCHEMA_PATH, SCHEMA_VERSION, get_connection
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from app.data import hole_section_data_repo
+from app.data._validate import require_well
+from app.data.db import (
+    DB_PATH,
+    SCHEMA_PATH,
+    SCHEMA_VERSION,
+    STATEMENT_CACHE_SIZE,
+    get_connection,
+    transaction,
+)
+from app.sections import builder
+
+
+_PLAIN_INDEX_RE = re.compile(r"^\s*CREATE\s+INDEX\b", re.IGNORECASE | re.MULTILINE)
+
+_TRAJECTORY_PLANNED_COLS = (
+    "kop_m",
+    "tvd_planned_m",
+    "md_planned_m",
+    "max_inc_planned_deg",
+    "azimuth_planned_deg",
+    "max_dls_planned_deg_per_30m",
+    "vs_planned_m",
+    "dist_planned_m",
+)
+_TRAJECTORY_ACTUAL_COLS = (
+    "tvd_at_td_m",
+    "md_at_td_m",
+    "inc_at_td_deg",
+    "azimuth_at_td_deg",
+    "max_dls_actual_deg_per_30m",
+    "vs_at_td_m",
+    "dist_at_td_m",
+)
+
+# (id(conn), schema, table) -> column names; the schema never changes under an
+# open connection (migrations run when the pooled connection is created), and
+# attached import files are forgotten on DETACH
+_TABLE_COLS_CACHE: Dict[Tuple[int, str, str], List[str]] = {}
+
+# [epoch second, formatted text]; merges stamp rows in loops, and the text only
+# changes once per second.
+_now_cache: List[Any] = [-1, ""]
 
 
 def iso_now() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    sec = int(time.time())
+    if sec != _now_cache[0]:
+        _now_cache[0] = sec
+        _now_cache[1] = datetime.fromtimestamp(sec, timezone.utc).isoformat()
+    return _now_cache[1]
 
 
-def _open_db(path: Path) -> sqlite3.Connection:
-    conn = sqlite3.connect(path)
-    conn.row_factory = sqlite3.Row
-    return conn
+def _configure(conn: sqlite3.Connection, schema: str = "main") -> None:
+    # Per-connection settings only. journal_mode is left alone on purpose: WAL is
+    # persistent and would rewrite a user's import/export file.
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute(f"PRAGMA {schema}.synchronous = NORMAL")
+    conn.execute(f"PRAGMA {schema}.mmap_size = 268435456")
+    conn.execute(f"PRAGMA {schema}.cache_size = -65536")
 
 
-def _table_columns(conn: sqlite3.Connection, table: str) -> List[str]:
-    rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
-    return [row[1] for row in rows]
+@contextmanager
+def _open_db(path: Path) -> Iterator[sqlite3.Connection]:
+    conn = sqlite3.connect(path, cached_statements=STATEMENT_CACHE_SIZE)
+    conn.row_factory = sqlite3.Row
+    _configure(conn)
+    try:
+        with conn:
+            yield conn
+    finally:
+        # the column cache is keyed by id(conn), which can be reused once it is gone
+        _forget_table_columns(conn)
+        conn.close()
+
+
+def _table_columns(
+    conn: sqlite3.Connection, table: str, schema: str = "main"
+) -> List[str]:
+    key = (id(conn), schema, table)
+    cols = _TABLE_COLS_CACHE.get(key)
+    if cols is None:
+        rows = conn.execute(f"PRAGMA {schema}.table_info({table})").fetchall()
+        cols = _TABLE_COLS_CACHE[key] = [row[1] for row in rows]
+    return cols
+
+
+def _forget_table_columns(conn: sqlite3.Connection, schema: Optional[str] = None) -> None:
+    for key in [
+        k for k in _TABLE_COLS_CACHE if k[0] == id(conn) and schema in (None, k[1])
+    ]:
+        del _TABLE_COLS_CACHE[key]
 
 
 def _get_meta(conn: sqlite3.Connection, key: str) -> str:
@@ -55,67 +135,115 @@ def _ensure_meta(conn: sqlite3.Connection) -> None:
 
 
 def _fetch_rows(
-    conn: sqlite3.Connection, table: str, where: str, params: Tuple[Any, ...]
-) -> List[Dict[str, Any]]:
-    rows = conn.execute(f"SELECT * FROM {table} WHERE {where}", params).fetchall()
-    return [{k: r[k] for k in r.keys()} for r in rows]
-
-
-def _insert_rows(
-    conn: sqlite3.Connection, table: str, rows: Iterable[Dict[str, Any]]
-) -> None:
-    rows = list(rows)
-    if not rows:
-        return
-    cols = list(rows[0].keys())
-    placeholders = ", ".join(["?"] * len(cols))
-    sql = f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({placeholders})"
-    conn.executemany(sql, [[r.get(c) for c in cols] for r in rows])
+    conn: sqlite3.Connection,
+    table: str,
+    cols: Sequence[str],
+    where: str,
+    params: Tuple[Any, ...],
+) -> List[sqlite3.Row]:
+    return conn.execute(
+        f"SELECT {', '.join(cols)} FROM {table} WHERE {where}", params
+    ).fetchall()
+
+
+def _existing_keys(
+    conn: sqlite3.Connection, table: str, key_cols: Tuple[str, ...], well_id: str
+) -> set:
+    cur = conn.execute(
+        f"SELECT {', '.join(key_cols)} FROM {table} WHERE well_id = ?", (well_id,)
+    )
+    return {tuple(row) for row in cur}
 
 
 def export_well_to_db(well_id: str, dest_path: str) -> None:
-    wid = (well_id or "").strip()
-    if not wid:
-        raise ValueError("well_id is required")
+    wid = require_well(well_id)
 
     out_path = Path(dest_path)
     if out_path.exists():
         raise ValueError("Export file already exists. Please choose another path.")
 
-    schema_sql = SCHEMA_PATH.read_text(encoding="utf-8")
+    # plain indexes are built once the rows are in, not maintained row by row
+    table_sql, index_sql = _split_schema(SCHEMA_PATH.read_text(encoding="utf-8"))
+
+    tables = [
+        "wells",
+        "well_identity",
+        "well_trajectory",
+        "well_section_nodes",
+        "well_hole_sections",
+        "well_hole_section_data",
+        "well_hse_ticket",
+        "well_hse_nozzle",
+    ]
 
-    with get_connection() as src, _open_db(out_path) as dst:
-        dst.executescript(schema_sql)
-        _ensure_meta(dst)
-        dst.execute(
-            "UPDATE app_meta SET meta_value = ? WHERE meta_key = ?",
-            (SCHEMA_VERSION, "schema_version"),
-        )
+    with _open_db(out_path) as dst:
+        dst.executescript(table_sql)
+        with transaction(dst):
+            _ensure_meta(dst)
+            dst.execute(
+                "UPDATE app_meta SET meta_value = ? WHERE meta_key = ?",
+                (SCHEMA_VERSION, "schema_version"),
+            )
+        dst_cols = {table: _table_columns(dst, table) for table in tables}
+
+    # copy inside SQLite: the rows never pass through Python objects
+    src = get_connection()
+    src.execute("ATTACH DATABASE ? AS exp", (str(out_path),))
+    try:
+        _configure(src, "exp")
+        # brand-new file that nothing else reads yet: journal in memory, no fsync
+        src.execute("PRAGMA exp.journal_mode = MEMORY")
+        src.execute("PRAGMA exp.synchronous = OFF")
+        # same version: the migrated app schema has every schema.sql column
+        same_schema = _get_meta(src, "schema_version") == SCHEMA_VERSION
+        with transaction(src):
+            for table in tables:
+                if same_schema:
+                    cols = ", ".join(dst_cols[table])
+                else:
+                    src_cols = set(_table_columns(src, table))
+                    cols = ", ".join([c for c in dst_cols[table] if c in src_cols])
+                if not cols:
+                    continue
+                src.execute(
+                    f"INSERT INTO exp.{table} ({cols}) SELECT {cols} FROM main.{table} WHERE well_id = ?",
+                    (wid,),
+                )
+    finally:
+        src.execute("DETACH DATABASE exp")
+
+    with _open_db(out_path) as dst:
+        dst.executescript(index_sql)
+
+
+def _split_schema(schema_sql: str) -> Tuple[str, str]:
+    """Split schema.sql into (tables and unique indexes, non-unique indexes)."""
+    tables: List[str] = []
+    indexes: List[str] = []
+    for stmt in schema_sql.split(";"):
+        if stmt.strip():
+            (indexes if _PLAIN_INDEX_RE.search(stmt) else tables).append(stmt + ";")
+    return "".join(tables), "".join(indexes)
+
+
+@lru_cache(maxsize=8)
+def _load_import_manifest(path: str, mtime_ns: int) -> Tuple[Dict[str, Any], str]:
+    with _open_db(Path(path)) as src:
+        _ensure_meta(src)
+        wells_rows = src.execute("SELECT * FROM wells").fetchall()
+        if len(wells_rows) != 1:
+            raise ValueError("Import file must contain exactly one well.")
+        return dict(zip(wells_rows[0].keys(), wells_rows[0])), _get_meta(src, "schema_version")
 
-        tables = [
-            "wells",
-            "well_identity",
-            "well_trajectory",
-            "well_section_nodes",
-            "well_hole_sections",
-            "well_hole_section_data",
-            "well_hse_ticket",
-            "well_hse_nozzle",
-        ]
 
-        for table in tables:
-            src_cols = set(_table_columns(src, table))
-            dst_cols = _table_columns(dst, table)
-            cols = [c for c in dst_cols if c in src_cols]
-            if not cols:
-                continue
-            rows = _fetch_rows(src, table, "well_id = ?", (wid,))
-            if not rows:
-                continue
-            filtered = [{k: r.get(k) for k in cols} for r in rows]
-            _insert_rows(dst, table, filtered)
+def _read_import_manifest(path: Path) -> Tuple[Dict[str, Any], str]:
+    """Return (wells row, schema_version) of an import file.
 
-        dst.commit()
+    Preview and import of the same file share one read; the file's mtime is part
+    of the cache key, so a changed file is read again. Callers must not mutate
+    the returned dict.
+    """
+    return _load_import_manifest(str(path), path.stat().st_mtime_ns)
 
 
 def import_well_from_db(src_path: str) -> Tuple[str, str]:
@@ -123,36 +251,41 @@ def import_well_from_db(src_path: str) -> Tuple[str, str]:
     if not path.exists():
         raise FileNotFoundError(f"Import file not found: {src_path}")
 
-    with _open_db(path) as src:
-        _ensure_meta(src)
-        wells_rows = src.execute("SELECT * FROM wells").fetchall()
-        if len(wells_rows) != 1:
-            raise ValueError("Import file must contain exactly one well.")
-        src_well = {k: wells_rows[0][k] for k in wells_rows[0].keys()}
-
-        src_well_id = str(src_well.get("well_id") or "")
-        src_well_name = str(src_well.get("well_name") or "").strip()
-        if not src_well_name:
-            raise ValueError("Imported well has no name.")
-
-        with get_connection() as dst:
+    src_well, _ = _read_import_manifest(path)
+    src_well_id = str(src_well.get("well_id") or "")
+    src_well_name = str(src_well.get("well_name") or "").strip()
+    if not src_well_name:
+        raise ValueError("Imported well has no name.")
+
+    # the merges run as INSERT ... SELECT / UPDATE statements against the
+    # attached file, so rows are compared and copied inside SQLite
+    dst = get_connection()
+    # fresh node ids come from the section builder, so imported and locally
+    # built nodes share one node_id format
+    dst.create_function("uuid4_str", 0, builder.uuid4_str)
+    dst.execute("ATTACH DATABASE ? AS src", (str(path),))
+    try:
+        _configure(dst, "src")
+        with transaction(dst):
             _ensure_meta(dst)
             row = dst.execute(
                 "SELECT well_id FROM wells WHERE well_name = ?",
                 (src_well_name,),
             ).fetchone()
             if row is None:
-                new_id = str(uuid.uuid4())
-                _insert_new_well(dst, new_id, src_well)
-                _copy_well_data(src, dst, src_well_id, new_id, merge=False)
-                dst.commit()
-                return new_id, src_well_name
+                dest_well_id = _uuid4_str()
+                _insert_new_well(dst, dest_well_id, src_well)
+                _copy_well_data(dst, src_well_id, dest_well_id, merge=False)
+            else:
+                dest_well_id = str(row["well_id"])
+                _merge_well(dst, dest_well_id, src_well)
+                _copy_well_data(dst, src_well_id, dest_well_id, merge=True)
+    finally:
+        dst.execute("DETACH DATABASE src")
+        _forget_table_columns(dst, "src")
 
-            dest_well_id = str(row["well_id"])
-            _merge_well(dst, dest_well_id, src_well)
-            _copy_well_data(src, dst, src_well_id, dest_well_id, merge=True)
-            dst.commit()
-            return dest_well_id, src_well_name
+    hole_section_data_repo.clear_cache()
+    return dest_well_id, src_well_name
 
 
 def preview_import(src_path: str) -> Dict[str, Any]:
@@ -160,50 +293,46 @@ def preview_import(src_path: str) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Import file not found: {src_path}")
 
-    with _open_db(path) as src, get_connection() as dst:
-        _ensure_meta(src)
-        _ensure_meta(dst)
-        src_schema = _get_meta(src, "schema_version")
-        dst_schema = _get_meta(dst, "schema_version")
+    src_well, src_schema = _read_import_manifest(path)
+    src_well_id = str(src_well.get("well_id") or "")
+    src_well_name = str(src_well.get("well_name") or "").strip()
+    if not src_well_name:
+        raise ValueError("Imported well has no name.")
 
-        wells_rows = src.execute("SELECT * FROM wells").fetchall()
-        if len(wells_rows) != 1:
-            raise ValueError("Import file must contain exactly one well.")
-        src_well = {k: wells_rows[0][k] for k in wells_rows[0].keys()}
-        src_well_id = str(src_well.get("well_id") or "")
-        src_well_name = str(src_well.get("well_name") or "").strip()
-        if not src_well_name:
-            raise ValueError("Imported well has no name.")
-
-        dest_row = dst.execute(
-            "SELECT well_id FROM wells WHERE well_name = ?",
-            (src_well_name,),
-        ).fetchone()
-        has_existing = dest_row is not None
-        dest_well_id = str(dest_row["well_id"]) if dest_row else ""
-
-        summary = {
-            "well_name": src_well_name,
-            "has_existing": has_existing,
-            "src_schema_version": src_schema,
-            "dst_schema_version": dst_schema,
-            "schema_mismatch": bool(src_schema and dst_schema and src_schema != dst_schema),
-            "identity_fill": 0,
-            "identity_conflict": 0,
-            "trajectory_actual_replace": False,
-            "trajectory_actual_src_md": None,
-            "trajectory_actual_dest_md": None,
-            "hole_section_fill": 0,
-            "hole_section_conflict": 0,
-            "hole_sections_new": 0,
-            "tickets_new": 0,
-            "nozzles_new": 0,
-            "section_nodes_new": 0,
-        }
+    dst = get_connection()
+    _ensure_meta(dst)
+    dst_schema = _get_meta(dst, "schema_version")
 
-        if not has_existing:
-            return summary
+    dest_row = dst.execute(
+        "SELECT well_id FROM wells WHERE well_name = ?",
+        (src_well_name,),
+    ).fetchone()
+    has_existing = dest_row is not None
+    dest_well_id = str(dest_row["well_id"]) if dest_row else ""
+
+    summary = {
+        "well_name": src_well_name,
+        "has_existing": has_existing,
+        "src_schema_version": src_schema,
+        "dst_schema_version": dst_schema,
+        "schema_mismatch": bool(src_schema and dst_schema and src_schema != dst_schema),
+        "identity_fill": 0,
+        "identity_conflict": 0,
+        "trajectory_actual_replace": False,
+        "trajectory_actual_src_md": None,
+        "trajectory_actual_dest_md": None,
+        "hole_section_fill": 0,
+        "hole_section_conflict": 0,
+        "hole_sections_new": 0,
+        "tickets_new": 0,
+        "nozzles_new": 0,
+        "section_nodes_new": 0,
+    }
+
+    if not has_existing:
+        return summary
 
+    with _open_db(path) as src:
         _preview_identity(src, dst, src_well_id, dest_well_id, summary)
         _preview_trajectory(src, dst, src_well_id, dest_well_id, summary)
         _preview_section_nodes(src, dst, src_well_id, dest_well_id, summary)
@@ -212,13 +341,18 @@ def preview_import(src_path: str) -> Dict[str, Any]:
         _preview_tickets(src, dst, src_well_id, dest_well_id, summary)
         _preview_nozzles(src, dst, src_well_id, dest_well_id, summary)
 
-        return summary
+    return summary
 
 
 def create_backup() -> str:
     now = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_path = DB_PATH.parent / f"wellops_backup_{now}.db"
-    backup_path.write_bytes(Path(DB_PATH).read_bytes())
+    # online backup API: a consistent snapshot (WAL included), copied page by page
+    bck = sqlite3.connect(backup_path)
+    try:
+        get_connection().backup(bck, pages=1000)
+    finally:
+        bck.close()
     return str(backup_path)
 
 
@@ -296,28 +430,85 @@ def _merge_well(conn: sqlite3.Connection, well_id: str, src_well: Dict[str, Any]
 
 
 def _copy_well_data(
-    src: sqlite3.Connection,
-    dst: sqlite3.Connection,
+    conn: sqlite3.Connection,
     src_well_id: str,
     dest_well_id: str,
     *,
     merge: bool,
 ) -> None:
-    _merge_identity(src, dst, src_well_id, dest_well_id, merge)
-    _merge_trajectory(src, dst, src_well_id, dest_well_id, merge)
-    _merge_section_nodes(src, dst, src_well_id, dest_well_id, merge)
-    _merge_hole_sections(src, dst, src_well_id, dest_well_id)
-    _merge_hole_section_data(src, dst, src_well_id, dest_well_id, merge)
-    _merge_tickets(src, dst, src_well_id, dest_well_id, merge)
-    _merge_nozzles(src, dst, src_well_id, dest_well_id, merge)
+    """Copy one well from the attached ``src`` schema into ``main``."""
+    now = iso_now()
+    _merge_identity(conn, src_well_id, dest_well_id, merge)
+    _merge_trajectory(conn, src_well_id, dest_well_id, merge, now)
+    _merge_section_nodes(conn, src_well_id, dest_well_id, merge, now)
+    _merge_hole_sections(conn, src_well_id, dest_well_id, now)
+    _merge_hole_section_data(conn, src_well_id, dest_well_id, merge, now)
+    # ticket/nozzle lines reference their hole's data row; lines for a hole
+    # without one would fail the foreign key and abort the whole import
+    has_data = (
+        "EXISTS (SELECT 1 FROM main.well_hole_section_data AS d"
+        " WHERE d.well_id = ? AND d.hole_key = s.hole_key)"
+    )
+    _insert_missing_rows(
+        conn,
+        "well_hse_ticket",
+        src_well_id,
+        dest_well_id,
+        f"s.hole_key <> '' AND s.line_no IS NOT NULL AND {has_data}",
+        where_params=(dest_well_id,),
+    )
+    _insert_missing_rows(
+        conn,
+        "well_hse_nozzle",
+        src_well_id,
+        dest_well_id,
+        f"s.hole_key <> '' AND s.bit_index IS NOT NULL AND s.line_no IS NOT NULL AND {has_data}",
+        where_params=(dest_well_id,),
+    )
+
+
+def _uuid4_str() -> str:
+    return str(uuid.uuid4())
+
+
+def _insert_missing_rows(
+    conn: sqlite3.Connection,
+    table: str,
+    src_well_id: str,
+    dest_well_id: str,
+    where: str = "1",
+    exprs: Optional[Dict[str, str]] = None,
+    where_params: Tuple[Any, ...] = (),
+) -> None:
+    """INSERT ... SELECT the attached well's rows that ``main`` does not have yet.
+
+    Columns are those both schemas share; ``exprs`` swaps a column for an SQL
+    expression over the source row ``s``. ``where_params`` binds any ``?`` in
+    ``where``. Rows that hit a key already present in ``main`` are skipped by
+    ON CONFLICT DO NOTHING.
+    """
+    src_cols = set(_table_columns(conn, table, "src"))
+    cols = [c for c in _table_columns(conn, table) if c in src_cols and c != "well_id"]
+    select_sql = ", ".join([(exprs or {}).get(c, f"s.{c}") for c in cols])
+    conn.execute(
+        f"""
+        INSERT INTO {table} (well_id, {', '.join(cols)})
+        SELECT ?, {select_sql} FROM src.{table} AS s
+        WHERE s.well_id = ? AND {where}
+        ON CONFLICT DO NOTHING
+        """,
+        (dest_well_id, src_well_id, *where_params),
+    )
+
+
+def _sql_blank(expr: str) -> str:
+    """SQL form of _is_blank for ``expr`` (NULL, or only ASCII whitespace)."""
+    return f"TRIM(COALESCE({expr}, ''), ' ' || char(9, 10, 11, 12, 13)) = ''"
 
 
 def _is_blank(value: Any) -> bool:
-    if value is None:
-        return True
-    if isinstance(value, str):
-        return not value.strip()
-    return False
+    # None and "" are by far the common blanks; only other strings need a strip
+    return value is None or value == "" or (isinstance(value, str) and not value.strip())
 
 
 def _preview_identity(
@@ -382,16 +573,13 @@ def _preview_section_nodes(
     dest_well_id: str,
     summary: Dict[str, Any],
 ) -> None:
-    rows = _fetch_rows(src, "well_section_nodes", "well_id = ?", (src_well_id,))
+    rows = _fetch_rows(src, "well_section_nodes", ("node_key",), "well_id = ?", (src_well_id,))
+    existing = _existing_keys(dst, "well_section_nodes", ("node_key",), dest_well_id)
     for r in rows:
-        node_key = r.get("node_key")
+        node_key = r["node_key"]
         if not node_key:
             continue
-        exists = dst.execute(
-            "SELECT 1 FROM well_section_nodes WHERE well_id = ? AND node_key = ?",
-            (dest_well_id, node_key),
-        ).fetchone()
-        if exists is None:
+        if (node_key,) not in existing:
             summary["section_nodes_new"] += 1
 
 
@@ -402,16 +590,13 @@ def _preview_hole_sections(
     dest_well_id: str,
     summary: Dict[str, Any],
 ) -> None:
-    rows = _fetch_rows(src, "well_hole_sections", "well_id = ?", (src_well_id,))
+    rows = _fetch_rows(src, "well_hole_sections", ("node_key",), "well_id = ?", (src_well_id,))
+    existing = _existing_keys(dst, "well_hole_sections", ("node_key",), dest_well_id)
     for r in rows:
-        node_key = r.get("node_key")
+        node_key = r["node_key"]
         if not node_key:
             continue
-        exists = dst.execute(
-            "SELECT 1 FROM well_hole_sections WHERE well_id = ? AND node_key = ?",
-            (dest_well_id, node_key),
-        ).fetchone()
-        if exists is None:
+        if (node_key,) not in existing:
             summary["hole_sections_new"] += 1
 
 
@@ -422,26 +607,27 @@ def _preview_hole_section_data(
     dest_well_id: str,
     summary: Dict[str, Any],
 ) -> None:
-    rows = _fetch_rows(src, "well_hole_section_data", "well_id = ?", (src_well_id,))
-    if not rows:
-        return
-    cols = _table_columns(dst, "well_hole_section_data")
+    # a column the import file lacks counts as blank, so only shared ones matter
+    src_cols = set(_table_columns(src, "well_hole_section_data"))
+    cols = tuple(
+        c
+        for c in _table_columns(dst, "well_hole_section_data")
+        if c in src_cols and c not in ("well_id", "hole_key", "updated_at")
+    )
+    rows = _fetch_rows(
+        src, "well_hole_section_data", ("hole_key",) + cols, "well_id = ?", (src_well_id,)
+    )
+    dest_sql = f"SELECT {', '.join(cols)} FROM well_hole_section_data WHERE well_id = ? AND hole_key = ?"
     for r in rows:
-        hole_key = r.get("hole_key")
+        hole_key = r["hole_key"]
         if not hole_key:
             continue
-        dest = dst.execute(
-            "SELECT * FROM well_hole_section_data WHERE well_id = ? AND hole_key = ?",
-            (dest_well_id, hole_key),
-        ).fetchone()
+        dest = dst.execute(dest_sql, (dest_well_id, hole_key)).fetchone()
         if dest is None:
-            filled = sum(1 for c in cols if c not in ("well_id", "hole_key", "updated_at") and not _is_blank(r.get(c)))
-            summary["hole_section_fill"] += filled
+            summary["hole_section_fill"] += sum(1 for c in cols if not _is_blank(r[c]))
             continue
         for c in cols:
-            if c in ("well_id", "hole_key", "updated_at"):
-                continue
-            src_val = r.get(c)
+            src_val = r[c]
             dest_val = dest[c]
             if _is_blank(dest_val) and not _is_blank(src_val):
                 summary["hole_section_fill"] += 1
@@ -449,6 +635,18 @@ def _preview_hole_section_data(
                 summary["hole_section_conflict"] += 1
 
 
+def _holes_with_data(
+    src: sqlite3.Connection,
+    dst: sqlite3.Connection,
+    src_well_id: str,
+    dest_well_id: str,
+) -> set:
+    """hole_keys that will have a well_hole_section_data row after the import."""
+    holes = _existing_keys(src, "well_hole_section_data", ("hole_key",), src_well_id)
+    holes |= _existing_keys(dst, "well_hole_section_data", ("hole_key",), dest_well_id)
+    return {hole_key for (hole_key,) in holes}
+
+
 def _preview_tickets(
     src: sqlite3.Connection,
     dst: sqlite3.Connection,
@@ -456,20 +654,17 @@ def _preview_tickets(
     dest_well_id: str,
     summary: Dict[str, Any],
 ) -> None:
-    rows = _fetch_rows(src, "well_hse_ticket", "well_id = ?", (src_well_id,))
+    rows = _fetch_rows(
+        src, "well_hse_ticket", ("hole_key", "line_no"), "well_id = ?", (src_well_id,)
+    )
+    existing = _existing_keys(dst, "well_hse_ticket", ("hole_key", "line_no"), dest_well_id)
+    holes = _holes_with_data(src, dst, src_well_id, dest_well_id)
     for r in rows:
-        hole_key = r.get("hole_key")
-        line_no = r.get("line_no")
-        if not hole_key or line_no is None:
+        hole_key = r["hole_key"]
+        line_no = r["line_no"]
+        if not hole_key or line_no is None or hole_key not in holes:
             continue
-        dest = dst.execute(
-            """
-            SELECT 1 FROM well_hse_ticket
-            WHERE well_id = ? AND hole_key = ? AND line_no = ?
-            """,
-            (dest_well_id, hole_key, line_no),
-        ).fetchone()
-        if dest is None:
+        if (hole_key, line_no) not in existing:
             summary["tickets_new"] += 1
 
 
@@ -480,335 +675,256 @@ def _preview_nozzles(
     dest_well_id: str,
     summary: Dict[str, Any],
 ) -> None:
-    rows = _fetch_rows(src, "well_hse_nozzle", "well_id = ?", (src_well_id,))
+    rows = _fetch_rows(
+        src,
+        "well_hse_nozzle",
+        ("hole_key", "bit_index", "line_no"),
+        "well_id = ?",
+        (src_well_id,),
+    )
+    existing = _existing_keys(
+        dst, "well_hse_nozzle", ("hole_key", "bit_index", "line_no"), dest_well_id
+    )
+    holes = _holes_with_data(src, dst, src_well_id, dest_well_id)
     for r in rows:
-        hole_key = r.get("hole_key")
-        bit_index = r.get("bit_index")
-        line_no = r.get("line_no")
-        if not hole_key or bit_index is None or line_no is None:
+        hole_key = r["hole_key"]
+        bit_index = r["bit_index"]
+        line_no = r["line_no"]
+        if not hole_key or bit_index is None or line_no is None or hole_key not in holes:
             continue
-        dest = dst.execute(
-            """
-            SELECT 1 FROM well_hse_nozzle
-            WHERE well_id = ? AND hole_key = ? AND bit_index = ? AND line_no = ?
-            """,
-            (dest_well_id, hole_key, bit_index, line_no),
-        ).fetchone()
-        if dest is None:
+        if (hole_key, bit_index, line_no) not in existing:
             summary["nozzles_new"] += 1
 
 
 def _merge_identity(
-    src: sqlite3.Connection,
-    dst: sqlite3.Connection,
+    conn: sqlite3.Connection,
     src_well_id: str,
     dest_well_id: str,
     merge: bool,
 ) -> None:
-    row = src.execute(
-        "SELECT * FROM well_identity WHERE well_id = ?",
-        (src_well_id,),
-    ).fetchone()
-    if row is None:
-        return
-    src_row = {k: row[k] for k in row.keys()}
-
-    dest_row = dst.execute(
-        "SELECT * FROM well_identity WHERE well_id = ?",
-        (dest_well_id,),
-    ).fetchone()
-
-    if dest_row is None:
-        cols = [c for c in src_row.keys() if c != "well_id"]
-        payload = {c: src_row.get(c) for c in cols}
-        payload["well_id"] = dest_well_id
-        _insert_rows(dst, "well_identity", [payload])
-        return
-
-    if not merge:
-        return
-
-    updates = {}
-    for key, value in src_row.items():
-        if key in ("well_id", "well_name"):
-            continue
-        if _is_blank(dest_row[key]) and not _is_blank(value):
-            updates[key] = value
-
-    if updates:
-        set_sql = ", ".join([f"{k} = ?" for k in updates.keys()])
-        dst.execute(
-            f"UPDATE well_identity SET {set_sql} WHERE well_id = ?",
-            tuple(updates.values()) + (dest_well_id,),
-        )
+    if merge:
+        # fill blank local fields from non-blank imported ones; well_name is the
+        # match key and never changes
+        src_cols = set(_table_columns(conn, "well_identity", "src"))
+        fills = [
+            f"{c} = CASE WHEN {_sql_blank(c)} THEN COALESCE(("
+            f"SELECT CASE WHEN {_sql_blank('s.' + c)} THEN NULL ELSE s.{c} END"
+            f" FROM src.well_identity AS s WHERE s.well_id = :src), {c}) ELSE {c} END"
+            for c in _table_columns(conn, "well_identity")
+            if c in src_cols and c not in ("well_id", "well_name")
+        ]
+        if fills:
+            conn.execute(
+                f"UPDATE well_identity SET {', '.join(fills)} WHERE well_id = :dest",
+                {"src": src_well_id, "dest": dest_well_id},
+            )
+    _insert_missing_rows(conn, "well_identity", src_well_id, dest_well_id)
 
 
 def _merge_trajectory(
-    src: sqlite3.Connection,
-    dst: sqlite3.Connection,
+    conn: sqlite3.Connection,
     src_well_id: str,
     dest_well_id: str,
     merge: bool,
+    updated_at: str,
 ) -> None:
-    src_row = src.execute(
-        "SELECT * FROM well_trajectory WHERE well_id = ?",
-        (src_well_id,),
-    ).fetchone()
-    if src_row is None:
-        return
-    src_row = {k: src_row[k] for k in src_row.keys()}
-
-    dest_row = dst.execute(
-        "SELECT * FROM well_trajectory WHERE well_id = ?",
-        (dest_well_id,),
-    ).fetchone()
-
-    if dest_row is None:
-        cols = [c for c in src_row.keys() if c != "well_id"]
-        payload = {c: src_row.get(c) for c in cols}
-        payload["well_id"] = dest_well_id
-        _insert_rows(dst, "well_trajectory", [payload])
-        return
-
-    if not merge:
-        return
-
-    dest_row = {k: dest_row[k] for k in dest_row.keys()}
-    planned_cols = [
-        "kop_m",
-        "tvd_planned_m",
-        "md_planned_m",
-        "max_inc_planned_deg",
-        "azimuth_planned_deg",
-        "max_dls_planned_deg_per_30m",
-        "vs_planned_m",
-        "dist_planned_m",
-    ]
-    actual_cols = [
-        "tvd_at_td_m",
-        "md_at_td_m",
-        "inc_at_td_deg",
-        "azimuth_at_td_deg",
-        "max_dls_actual_deg_per_30m",
-        "vs_at_td_m",
-        "dist_at_td_m",
-    ]
-
-    updates: Dict[str, Any] = {}
-    for col in planned_cols:
-        if dest_row.get(col) is None and src_row.get(col) is not None:
-            updates[col] = src_row.get(col)
-
-    src_md = src_row.get("md_at_td_m")
-    dest_md = dest_row.get("md_at_td_m")
-    pick_src = False
-    if dest_md is None and src_md is not None:
-        pick_src = True
-    elif src_md is not None and dest_md is not None and float(src_md) > float(dest_md):
-        pick_src = True
-
-    if pick_src:
-        for col in actual_cols:
-            updates[col] = src_row.get(col)
-
-    if updates:
-        updates["updated_at"] = iso_now()
-        set_sql = ", ".join([f"{k} = ?" for k in updates.keys()])
-        dst.execute(
-            f"UPDATE well_trajectory SET {set_sql} WHERE well_id = ?",
-            tuple(updates.values()) + (dest_well_id,),
+    if merge:
+        params = {"src": src_well_id, "dest": dest_well_id, "now": updated_at}
+        # planned values only fill gaps
+        planned = ", ".join(
+            f"{c} = COALESCE({c}, (SELECT {c} FROM src.well_trajectory WHERE well_id = :src))"
+            for c in _TRAJECTORY_PLANNED_COLS
+        )
+        planned_gap = " OR ".join(
+            f"(well_trajectory.{c} IS NULL AND s.{c} IS NOT NULL)"
+            for c in _TRAJECTORY_PLANNED_COLS
+        )
+        conn.execute(
+            f"""
+            UPDATE well_trajectory SET {planned}, updated_at = :now
+            WHERE well_id = :dest AND EXISTS (
+              SELECT 1 FROM src.well_trajectory AS s
+              WHERE s.well_id = :src AND ({planned_gap})
+            )
+            """,
+            params,
+        )
+        # the actual (at TD) block is taken as a whole from the deeper survey
+        actual = ", ".join(_TRAJECTORY_ACTUAL_COLS)
+        conn.execute(
+            f"""
+            UPDATE well_trajectory
+            SET ({actual}) = (SELECT {actual} FROM src.well_trajectory WHERE well_id = :src),
+                updated_at = :now
+            WHERE well_id = :dest AND EXISTS (
+              SELECT 1 FROM src.well_trajectory AS s
+              WHERE s.well_id = :src AND s.md_at_td_m IS NOT NULL
+                AND (well_trajectory.md_at_td_m IS NULL
+                     OR CAST(s.md_at_td_m AS REAL) > CAST(well_trajectory.md_at_td_m AS REAL))
+            )
+            """,
+            params,
         )
+    _insert_missing_rows(conn, "well_trajectory", src_well_id, dest_well_id)
 
 
 def _merge_section_nodes(
-    src: sqlite3.Connection,
-    dst: sqlite3.Connection,
+    conn: sqlite3.Connection,
     src_well_id: str,
     dest_well_id: str,
     merge: bool,
+    updated_at: str,
 ) -> None:
-    rows = _fetch_rows(src, "well_section_nodes", "well_id = ?", (src_well_id,))
-    if not rows:
-        return
-
-    if not merge:
-        new_rows = []
-        for r in rows:
-            r = dict(r)
-            r["well_id"] = dest_well_id
-            new_rows.append(r)
-        _insert_rows(dst, "well_section_nodes", new_rows)
-        return
-
-    for r in rows:
-        node_key = r.get("node_key")
-        if not node_key:
-            continue
-        dest = dst.execute(
-            "SELECT * FROM well_section_nodes WHERE well_id = ? AND node_key = ?",
-            (dest_well_id, node_key),
-        ).fetchone()
-        if dest is None:
-            node_id = r.get("node_id")
-            if node_id:
-                exists = dst.execute(
-                    "SELECT 1 FROM well_section_nodes WHERE node_id = ?",
-                    (node_id,),
-                ).fetchone()
-                if exists:
-                    r["node_id"] = str(uuid.uuid4())
-            r["well_id"] = dest_well_id
-            _insert_rows(dst, "well_section_nodes", [r])
-            continue
-
-        updates = {}
-        for flag in ("is_enabled", "is_selected", "is_completed"):
-            if int(dest[flag]) == 0 and int(r.get(flag) or 0) == 1:
-                updates[flag] = 1
-        if _is_blank(dest["state_json"]) and not _is_blank(r.get("state_json")):
-            updates["state_json"] = r.get("state_json")
-        if updates:
-            updates["updated_at"] = iso_now()
-            set_sql = ", ".join([f"{k} = ?" for k in updates.keys()])
-            dst.execute(
-                f"UPDATE well_section_nodes SET {set_sql} WHERE well_id = ? AND node_key = ?",
-                tuple(updates.values()) + (dest_well_id, node_key),
+    if merge:
+        dest_nodes = {
+            row["node_key"]: row
+            for row in conn.execute(
+                """
+                SELECT node_key, is_enabled, is_selected, is_completed, state_json
+                FROM well_section_nodes WHERE well_id = ?
+                """,
+                (dest_well_id,),
             )
+        }
+        # the flags only ever go 0 -> 1 and state_json only fills a blank, so the
+        # merged row is known up front: one static UPDATE, only for rows that change
+        params = []
+        for r in conn.execute(
+            """
+            SELECT node_key, is_enabled, is_selected, is_completed, state_json
+            FROM src.well_section_nodes WHERE well_id = ?
+            """,
+            (src_well_id,),
+        ):
+            node_key = r["node_key"]
+            dest = dest_nodes.get(node_key) if node_key else None
+            if dest is None:
+                continue
+            merged = [
+                1 if int(dest[flag]) == 0 and int(r[flag] or 0) == 1 else dest[flag]
+                for flag in ("is_enabled", "is_selected", "is_completed")
+            ]
+            fill_state = _is_blank(dest["state_json"]) and not _is_blank(r["state_json"])
+            state_json = r["state_json"] if fill_state else dest["state_json"]
+            if fill_state or merged != [dest["is_enabled"], dest["is_selected"], dest["is_completed"]]:
+                params.append((*merged, state_json, updated_at, dest_well_id, node_key))
+        conn.executemany(
+            """
+            UPDATE well_section_nodes
+            SET is_enabled = ?, is_selected = ?, is_completed = ?, state_json = ?,
+                updated_at = ?
+            WHERE well_id = ? AND node_key = ?
+            """,
+            params,
+        )
+
+    # node_id is unique across all wells, so source ids can't always be kept.
+    # Map every source node to its id in main first: the destination node with
+    # the same node_key (merge), else its own id if free, else a fresh one.
+    # node_id and parent_id are then rewritten through the same map, so the
+    # copied tree stays linked to itself.
+    conn.execute("DROP TABLE IF EXISTS temp.import_node_map")
+    conn.execute(
+        "CREATE TEMP TABLE import_node_map (old_id TEXT PRIMARY KEY, new_id TEXT NOT NULL)"
+    )
+    try:
+        conn.execute(
+            """
+            INSERT INTO temp.import_node_map (old_id, new_id)
+            SELECT s.node_id,
+                   COALESCE(
+                     d.node_id,
+                     CASE WHEN EXISTS (SELECT 1 FROM main.well_section_nodes AS x
+                                       WHERE x.node_id = s.node_id)
+                          THEN uuid4_str() ELSE s.node_id END
+                   )
+            FROM src.well_section_nodes AS s
+            LEFT JOIN main.well_section_nodes AS d
+              ON d.well_id = ? AND d.node_key = s.node_key
+            WHERE s.well_id = ? AND s.node_key <> '' AND s.node_id IS NOT NULL
+            """,
+            (dest_well_id, src_well_id),
+        )
+        _insert_missing_rows(
+            conn,
+            "well_section_nodes",
+            src_well_id,
+            dest_well_id,
+            "s.node_key <> ''",
+            {
+                "node_id": (
+                    "(SELECT m.new_id FROM temp.import_node_map AS m"
+                    " WHERE m.old_id = s.node_id)"
+                ),
+                "parent_id": (
+                    "COALESCE((SELECT m.new_id FROM temp.import_node_map AS m"
+                    " WHERE m.old_id = s.parent_id), s.parent_id)"
+                ),
+            },
+        )
+    finally:
+        conn.execute("DROP TABLE temp.import_node_map")
 
 
 def _merge_hole_sections(
-    src: sqlite3.Connection,
-    dst: sqlite3.Connection,
+    conn: sqlite3.Connection,
     src_well_id: str,
     dest_well_id: str,
+    updated_at: str,
 ) -> None:
-    rows = _fetch_rows(src, "well_hole_sections", "well_id = ?", (src_well_id,))
-    if not rows:
-        return
-    for r in rows:
-        node_key = r.get("node_key")
-        if not node_key:
-            continue
-        exists = dst.execute(
-            "SELECT 1 FROM well_hole_sections WHERE well_id = ? AND node_key = ?",
-            (dest_well_id, node_key),
-        ).fetchone()
-        if exists:
-            dst.execute(
-                "UPDATE well_hole_sections SET is_enabled = 1 WHERE well_id = ? AND node_key = ?",
-                (dest_well_id, node_key),
-            )
-        else:
-            dst.execute(
-                """
-                INSERT INTO well_hole_sections (well_id, node_key, is_enabled, updated_at)
-                VALUES (?, ?, 1, ?)
-                """,
-                (dest_well_id, node_key, iso_now()),
-            )
+    conn.execute(
+        """
+        INSERT INTO well_hole_sections (well_id, node_key, is_enabled, updated_at)
+        SELECT ?, node_key, 1, ? FROM src.well_hole_sections
+        WHERE well_id = ? AND node_key <> ''
+        ON CONFLICT (well_id, node_key) DO UPDATE SET is_enabled = 1
+        """,
+        (dest_well_id, updated_at, src_well_id),
+    )
 
 
 def _merge_hole_section_data(
-    src: sqlite3.Connection,
-    dst: sqlite3.Connection,
+    conn: sqlite3.Connection,
     src_well_id: str,
     dest_well_id: str,
     merge: bool,
+    updated_at: str,
 ) -> None:
-    rows = _fetch_rows(src, "well_hole_section_data", "well_id = ?", (src_well_id,))
-    if not rows:
-        return
-
-    cols = _table_columns(dst, "well_hole_section_data")
-    for r in rows:
-        hole_key = r.get("hole_key")
-        if not hole_key:
-            continue
-        dest = dst.execute(
-            "SELECT * FROM well_hole_section_data WHERE well_id = ? AND hole_key = ?",
-            (dest_well_id, hole_key),
-        ).fetchone()
-        if dest is None:
-            payload = {c: r.get(c) for c in cols if c in r}
-            payload["well_id"] = dest_well_id
-            payload["hole_key"] = hole_key
-            _insert_rows(dst, "well_hole_section_data", [payload])
-            continue
-
-        if not merge:
-            continue
-
-        updates = {}
-        for c in cols:
-            if c in ("well_id", "hole_key", "updated_at"):
-                continue
-            if _is_blank(dest[c]) and not _is_blank(r.get(c)):
-                updates[c] = r.get(c)
-        if updates:
-            updates["updated_at"] = iso_now()
-            set_sql = ", ".join([f"{k} = ?" for k in updates.keys()])
-            dst.execute(
-                f"UPDATE well_hole_section_data SET {set_sql} WHERE well_id = ? AND hole_key = ?",
-                tuple(updates.values()) + (dest_well_id, hole_key),
+    if merge:
+        src_cols = set(_table_columns(conn, "well_hole_section_data", "src"))
+        cols = tuple(
+            c
+            for c in _table_columns(conn, "well_hole_section_data")
+            if c in src_cols and c not in ("well_id", "hole_key", "updated_at")
+        )
+        select_sql = ", ".join(("hole_key",) + cols)
+        dest_rows = {
+            row["hole_key"]: row
+            for row in conn.execute(
+                f"SELECT {select_sql} FROM well_hole_section_data WHERE well_id = ?",
+                (dest_well_id,),
             )
+        }
+        # the merged row is decided here, so one static UPDATE serves every row
+        params = []
+        for r in conn.execute(
+            f"SELECT {select_sql} FROM src.well_hole_section_data WHERE well_id = ? AND hole_key <> ''",
+            (src_well_id,),
+        ):
+            dest = dest_rows.get(r["hole_key"])
+            if dest is None:
+                continue
+            merged = [
+                r[c] if _is_blank(dest[c]) and not _is_blank(r[c]) else dest[c] for c in cols
+            ]
+            if merged != [dest[c] for c in cols]:
+                params.append((*merged, updated_at, dest_well_id, r["hole_key"]))
+        set_sql = ", ".join([f"{c} = ?" for c in cols])
+        conn.executemany(
+            f"UPDATE well_hole_section_data SET {set_sql}, updated_at = ? WHERE well_id = ? AND hole_key = ?",
+            params,
+        )
 
-
-def _merge_tickets(
-    src: sqlite3.Connection,
-    dst: sqlite3.Connection,
-    src_well_id: str,
-    dest_well_id: str,
-    merge: bool,
-) -> None:
-    rows = _fetch_rows(src, "well_hse_ticket", "well_id = ?", (src_well_id,))
-    if not rows:
-        return
-    for r in rows:
-        hole_key = r.get("hole_key")
-        line_no = r.get("line_no")
-        if not hole_key or line_no is None:
-            continue
-        dest = dst.execute(
-            """
-            SELECT 1 FROM well_hse_ticket
-            WHERE well_id = ? AND hole_key = ? AND line_no = ?
-            """,
-            (dest_well_id, hole_key, line_no),
-        ).fetchone()
-        if dest is None:
-            r = dict(r)
-            r["well_id"] = dest_well_id
-            _insert_rows(dst, "well_hse_ticket", [r])
-        elif not merge:
-            continue
-
-
-def _merge_nozzles(
-    src: sqlite3.Connection,
-    dst: sqlite3.Connection,
-    src_well_id: str,
-    dest_well_id: str,
-    merge: bool,
-) -> None:
-    rows = _fetch_rows(src, "well_hse_nozzle", "well_id = ?", (src_well_id,))
-    if not rows:
-        return
-    for r in rows:
-        hole_key = r.get("hole_key")
-        bit_index = r.get("bit_index")
-        line_no = r.get("line_no")
-        if not hole_key or bit_index is None or line_no is None:
-            continue
-        dest = dst.execute(
-            """
-            SELECT 1 FROM well_hse_nozzle
-            WHERE well_id = ? AND hole_key = ? AND bit_index = ? AND line_no = ?
-            """,
-            (dest_well_id, hole_key, bit_index, line_no),
-        ).fetchone()
-        if dest is None:
-            r = dict(r)
-            r["well_id"] = dest_well_id
-            _insert_rows(dst, "well_hse_nozzle", [r])
-        elif not merge:
-            continue
+    _insert_missing_rows(
+        conn, "well_hole_section_data", src_well_id, dest_well_id, "s.hole_key <> ''"
+    )
@@ -5,9 +5,54 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from app.data._validate import clean_key, require_well
 from app.data.db import get_connection
 
 
+_SQL_INSERT_WELL = """
+    INSERT INTO wells (
+      well_id,
+      well_name,
+      operation_type,
+      status,
+      step1_done,
+      section_template_key,
+      sections_version,
+      created_at,
+      updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# node_count comes from a correlated COUNT on idx_nodes_well (covering), so
+# the tree gets per-well counts without one query per well.
+_SQL_LIST_WELLS = """
+    SELECT w.well_id, w.well_name, w.operation_type, w.status, w.created_at, w.updated_at,
+           (SELECT COUNT(*) FROM well_section_nodes n WHERE n.well_id = w.well_id)
+    FROM wells w
+    ORDER BY w.created_at DESC
+"""
+
+_SQL_LIST_WELLS_BY_STATUS = """
+    SELECT w.well_id, w.well_name, w.operation_type, w.status, w.created_at, w.updated_at,
+           (SELECT COUNT(*) FROM well_section_nodes n WHERE n.well_id = w.well_id)
+    FROM wells w
+    WHERE w.status = ?
+    ORDER BY w.created_at DESC
+"""
+
+_SQL_GET_WELL = """
+    SELECT well_id, well_name, operation_type, status, step1_done,
+           section_template_key, sections_version,
+           created_at, updated_at
+    FROM wells
+    WHERE well_id = ?
+"""
+
+# Every per-well table references wells ON DELETE CASCADE (ticket and nozzle
+# lines also cascade from well_hole_section_data), so one DELETE removes it all.
+_SQL_DELETE_WELL = "DELETE FROM wells WHERE well_id = ?"
+
+
 def iso_now() -> str:
     # UTC ISO 8601 (schema ile uyumlu: TEXT)
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
@@ -35,33 +80,21 @@ def create_draft_well(well_name: str, operation_type: str | None = None) -> str:
 
     op_type = (operation_type or "").strip() or None
 
-    with get_connection() as conn:
-        conn.execute(
-            """
-            INSERT INTO wells (
-              well_id,
-              well_name,
-              operation_type,
-              status,
-              step1_done,
-              section_template_key,
-              sections_version,
-              created_at,
-              updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                well_id,
-                name,
-                op_type,
-                "DRAFT",
-                0,
-                None,
-                None,
-                now,
-                now,
-            ),
-        )
+    conn = get_connection()
+    conn.execute(
+        _SQL_INSERT_WELL,
+        (
+            well_id,
+            name,
+            op_type,
+            "DRAFT",
+            0,
+            None,
+            None,
+            now,
+            now,
+        ),
+    )
 
     return well_id
 
@@ -76,31 +109,29 @@ def list_wells(status: Optional[str] = None) -> List[Dict[str, Any]]:
       - status: str
       - created_at: str
       - updated_at: str
+      - node_count: int (section tree nodes; 0 before the tree is built)
     """
-    sql = """
-        SELECT well_id, well_name, operation_type, status, created_at, updated_at
-        FROM wells
-    """
-    params: tuple = ()
+    conn = get_connection()
+    # Plain tuples for this cursor only: skips sqlite3.Row allocation and
+    # by-name lookups. TEXT columns already come back as str.
+    cur = conn.cursor()
+    cur.row_factory = None
     if status:
-        sql += " WHERE status = ?"
-        params = (status,)
-
-    sql += " ORDER BY created_at DESC"
-
-    with get_connection() as conn:
-        rows = conn.execute(sql, params).fetchall()
+        cur.execute(_SQL_LIST_WELLS_BY_STATUS, (status,))
+    else:
+        cur.execute(_SQL_LIST_WELLS)
 
     return [
         {
-            "id": str(r["well_id"]),
-            "name": str(r["well_name"]),
-            "operation_type": str(r["operation_type"] or ""),
-            "status": str(r["status"]),
-            "created_at": str(r["created_at"]),
-            "updated_at": str(r["updated_at"]),
+            "id": well_id,
+            "name": well_name,
+            "operation_type": operation_type or "",
+            "status": well_status,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "node_count": node_count,
         }
-        for r in rows
+        for well_id, well_name, operation_type, well_status, created_at, updated_at, node_count in cur
     ]
 
 
@@ -108,21 +139,12 @@ def get_well(well_id: str) -> Optional[Dict[str, Any]]:
     """
     Fetch single well by id. Useful for future wiring.
     """
-    wid = (well_id or "").strip()
+    wid = clean_key(well_id)
     if not wid:
         return None
 
-    with get_connection() as conn:
-        r = conn.execute(
-            """
-            SELECT well_id, well_name, operation_type, status, step1_done,
-                   section_template_key, sections_version,
-                   created_at, updated_at
-            FROM wells
-            WHERE well_id = ?
-            """,
-            (wid,),
-        ).fetchone()
+    conn = get_connection()
+    r = conn.execute(_SQL_GET_WELL, (wid,)).fetchone()
 
     if r is None:
         return None
@@ -142,42 +164,10 @@ def get_well(well_id: str) -> Optional[Dict[str, Any]]:
 
 def delete_well(well_id: str) -> None:
     """
-    Permanently deletes a well and all related section nodes.
+    Permanently deletes a well and all related rows. A single DELETE on wells
+    cascades to every child table, so it is atomic on its own.
     """
-    wid = (well_id or "").strip()
-    if not wid:
-        raise ValueError("well_id is required")
-
-    with get_connection() as conn:
-        conn.execute(
-            "DELETE FROM well_section_nodes WHERE well_id = ?",
-            (wid,),
-        )
-        conn.execute(
-            "DELETE FROM well_hse_ticket WHERE well_id = ?",
-            (wid,),
-        )
-        conn.execute(
-            "DELETE FROM well_hse_nozzle WHERE well_id = ?",
-            (wid,),
-        )
-        conn.execute(
-            "DELETE FROM well_hole_section_data WHERE well_id = ?",
-            (wid,),
-        )
-        conn.execute(
-            "DELETE FROM well_hole_sections WHERE well_id = ?",
-            (wid,),
-        )
-        conn.execute(
-            "DELETE FROM well_trajectory WHERE well_id = ?",
-            (wid,),
-        )
-        conn.execute(
-            "DELETE FROM well_identity WHERE well_id = ?",
-            (wid,),
-        )
-        conn.execute(
-            "DELETE FROM wells WHERE well_id = ?",
-            (wid,),
-        )
+    wid = require_well(well_id)
+
+    conn = get_connection()
+    conn.execute(_SQL_DELETE_WELL, (wid,))
@@ -4,14 +4,19 @@ from pathlib import Path
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication
 
-from app.ui.main_windows import MainWindow
+
+_ICON_PATH = Path(__file__).resolve().parent / "assets" / "icon" / "app.ico"
 
 
 def main() -> int:
     app = QApplication(sys.argv)
-    icon_path = Path(__file__).resolve().parent / "assets" / "icon" / "app.ico"
-    if icon_path.exists():
-        app.setWindowIcon(QIcon(str(icon_path)))
+    if _ICON_PATH.exists():
+        app.setWindowIcon(QIcon(str(_ICON_PATH)))
+
+    # Imported here so the QApplication exists before the (large) UI package
+    # and its widget modules are loaded.
+    from app.ui.main_windows import MainWindow
+
     win = MainWindow()
     win.resize(1200, 800)
     win.show()
@@ -1,21 +1,21 @@
 from __future__ import annotations
 
-import copy
 import json
+import time
 import uuid
-from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from app.sections.repository import load_template
 
 
 def iso_now() -> str:
-    # UTC ISO 8601
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    # UTC ISO 8601, seconds precision (same text as datetime.isoformat())
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
 
 
 def uuid4_str() -> str:
-    return str(uuid.uuid4())
+    # 32-char hex form: node ids are opaque, skip building the dashed string.
+    return uuid.uuid4().hex
 
 
 # -----------------------------
@@ -35,14 +35,34 @@ def choose_template(step1_context: Dict[str, Any]) -> Tuple[str, int]:
 # -----------------------------
 # Rules engine (minimal)
 # -----------------------------
+def _clone_json(o: Any) -> Any:
+    """
+    Copy a JSON-shaped value: new dicts/lists all the way down, primitives
+    shared. Much cheaper than copy.deepcopy for template trees.
+    """
+    if isinstance(o, dict):
+        return {k: _clone_json(v) for k, v in o.items()}
+    if isinstance(o, list):
+        return [_clone_json(v) for v in o]
+    return o
+
+
 def apply_rules(template: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Applies template.rules to a deep-copied template object.
+    Applies template.rules to a deep copy of the template object
+    (the input may be the shared, cached template and is never modified).
     Supported:
       - when: {field, op=equals, value}
       - then: [{action: enable/disable/select/deselect, target: node_key}]
+
+    A template without rules is returned as-is (no copy, defaults not filled
+    in): treat the result as read-only. _collect_nodes applies the same
+    enabled/selected defaults when materializing.
     """
-    t = copy.deepcopy(template)
+    if not template.get("rules"):
+        return template
+
+    t = _clone_json(template)
 
     def match(cond: Dict[str, Any]) -> bool:
         field = cond.get("field")
@@ -53,113 +73,126 @@ def apply_rules(template: Dict[str, Any], context: Dict[str, Any]) -> Dict[str,
             return actual == value
         return False
 
-    def normalize_defaults(node: Dict[str, Any]) -> None:
-        nt = node.get("node_type")
-        if nt in ("SECTION", "ITEM"):
-            node.setdefault("enabled", True)
-        if nt == "SECTION":
-            node.setdefault("selected", False)
-        for ch in node.get("children", []) or []:
-            normalize_defaults(ch)
+    key_index: Dict[str, Dict[str, Any]] = {}
 
-    def set_node_flag(root: Dict[str, Any], target_key: str, action: str) -> None:
+    def normalize_defaults(root: Dict[str, Any]) -> None:
+        # Also indexes nodes by node_key so rule actions are direct lookups.
         stack = [root]
         while stack:
-            n = stack.pop()
-            if n.get("node_key") == target_key:
-                if action == "enable":
-                    n["enabled"] = True
-                elif action == "disable":
-                    n["enabled"] = False
-                elif action == "select":
-                    n["selected"] = True
-                elif action == "deselect":
-                    n["selected"] = False
-                return
-            stack.extend(n.get("children", []) or [])
+            node = stack.pop()
+            nt = node.get("node_type")
+            if nt in ("SECTION", "ITEM"):
+                node.setdefault("enabled", True)
+            if nt == "SECTION":
+                node.setdefault("selected", False)
+            key = node.get("node_key")
+            if key is not None:
+                key_index.setdefault(key, node)
+            # reversed so nodes are visited in template (pre-)order
+            stack.extend(reversed(node.get("children", []) or []))
+
+    def set_node_flag(target_key: str, action: str) -> None:
+        n = key_index.get(target_key)
+        if n is None:
+            return
+        if action == "enable":
+            n["enabled"] = True
+        elif action == "disable":
+            n["enabled"] = False
+        elif action == "select":
+            n["selected"] = True
+        elif action == "deselect":
+            n["selected"] = False
 
     normalize_defaults(t["root"])
 
-    for rule in t.get("rules", []) or []:
+    for rule in t["rules"]:
         if not match(rule.get("when", {})):
             continue
         for action in rule.get("then", []) or []:
             act = action.get("action")
             target = action.get("target")
             if act and target:
-                set_node_flag(t["root"], target, act)
+                set_node_flag(target, act)
 
     return t
 
 
 # -----------------------------
 # DB helpers (sqlite3 compatible)
-# Expect: conn is sqlite3.Connection (or anything with .execute and context manager)
+# Expect: conn is the sqlite3.Connection from app.data.db.get_connection()
+# (autocommit; callers own the transaction around multi-statement writes)
 # -----------------------------
+_SQL_HAS_ANY_NODES = "SELECT 1 FROM well_section_nodes WHERE well_id = ? LIMIT 1"
+
+_SQL_DELETE_NODES = "DELETE FROM well_section_nodes WHERE well_id = ?"
+
+_SQL_SELECT_SECTIONS_META = """
+    SELECT w.section_template_key, w.sections_version,
+           EXISTS (SELECT 1 FROM well_section_nodes n WHERE n.well_id = w.well_id)
+    FROM wells w
+    WHERE w.well_id = ?
+"""
+
+_SQL_UPDATE_SECTIONS_META = """
+    UPDATE wells
+    SET section_template_key = ?, sections_version = ?, updated_at = ?
+    WHERE well_id = ?
+"""
+
+_SQL_INSERT_NODE = """
+    INSERT INTO well_section_nodes (
+      node_id, well_id, parent_id, node_key, title, node_type, order_index,
+      is_enabled, is_selected, is_completed, state_json,
+      created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SET_SECTION_SELECTED = """
+    UPDATE well_section_nodes
+    SET is_selected = ?, updated_at = ?
+    WHERE well_id = ? AND node_key = ? AND node_type = 'SECTION'
+"""
+
+_SQL_SELECTED_SECTIONS = """
+    SELECT node_key
+    FROM well_section_nodes
+    WHERE well_id = ?
+      AND node_type = 'SECTION'
+      AND is_enabled = 1
+      AND is_selected = 1
+    ORDER BY order_index ASC
+"""
+
+
 def db_has_any_nodes(conn, well_id: str) -> bool:
-    row = conn.execute(
-        "SELECT 1 FROM well_section_nodes WHERE well_id = ? LIMIT 1",
-        (well_id,),
-    ).fetchone()
+    row = conn.execute(_SQL_HAS_ANY_NODES, (well_id,)).fetchone()
     return row is not None
 
 
 def db_delete_nodes(conn, well_id: str) -> None:
-    conn.execute("DELETE FROM well_section_nodes WHERE well_id = ?", (well_id,))
+    conn.execute(_SQL_DELETE_NODES, (well_id,))
 
 
 def db_get_well_sections_meta(conn, well_id: str) -> Optional[Dict[str, Any]]:
-    row = conn.execute(
-        "SELECT section_template_key, sections_version FROM wells WHERE well_id = ?",
-        (well_id,),
-    ).fetchone()
+    """Template key/version of the well plus whether it has any nodes yet."""
+    row = conn.execute(_SQL_SELECT_SECTIONS_META, (well_id,)).fetchone()
     if row is None:
         return None
-    return {"section_template_key": row[0], "sections_version": row[1]}
+    return {"section_template_key": row[0], "sections_version": row[1], "has_nodes": bool(row[2])}
 
 
 def db_update_well_sections_meta(conn, well_id: str, template_key: str, version: int, now: str) -> None:
-    conn.execute(
-        """
-        UPDATE wells
-        SET section_template_key = ?, sections_version = ?, updated_at = ?
-        WHERE well_id = ?
-        """,
-        (template_key, version, now, well_id),
-    )
-
-
-def db_insert_node(
-    conn,
-    *,
-    node_id: str,
-    well_id: str,
-    parent_id: Optional[str],
-    node_key: str,
-    title: str,
-    node_type: str,
-    order_index: int,
-    is_enabled: int,
-    is_selected: int,
-    is_completed: int,
-    state_json: Optional[str],
-    created_at: str,
-    updated_at: str,
-) -> None:
-    conn.execute(
-        """
-        INSERT INTO well_section_nodes (
-          node_id, well_id, parent_id, node_key, title, node_type, order_index,
-          is_enabled, is_selected, is_completed, state_json,
-          created_at, updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            node_id, well_id, parent_id, node_key, title, node_type, order_index,
-            is_enabled, is_selected, is_completed, state_json,
-            created_at, updated_at
-        ),
-    )
+    conn.execute(_SQL_UPDATE_SECTIONS_META, (template_key, version, now, well_id))
+
+
+def db_insert_nodes(conn, rows: List[Tuple[Any, ...]]) -> None:
+    """
+    rows: tuples in column order (node_id, well_id, parent_id, node_key, title,
+    node_type, order_index, is_enabled, is_selected, is_completed, state_json,
+    created_at, updated_at).
+    """
+    conn.executemany(_SQL_INSERT_NODE, rows)
 
 
 # -----------------------------
@@ -170,62 +203,62 @@ def ensure_section_tree(conn, well_id: str, step1_context: Dict[str, Any]) -> No
     Idempotent behavior:
       - if well already has same template_key/version AND nodes exist -> do nothing
       - else: rebuild nodes for this well (MVP: delete+insert)
+    Run inside a transaction so the check and the rebuild apply together.
     """
     template_key, version = choose_template(step1_context)
 
     meta = db_get_well_sections_meta(conn, well_id)
     now = iso_now()
 
-    if meta and meta.get("section_template_key") == template_key and meta.get("sections_version") == version:
-        if db_has_any_nodes(conn, well_id):
-            return
+    if (
+        meta
+        and meta.get("section_template_key") == template_key
+        and meta.get("sections_version") == version
+        and meta.get("has_nodes")
+    ):
+        return
 
     raw = load_template(template_key, version)
     templ = apply_rules(raw, step1_context)
 
-    with conn:  # transaction
-        db_delete_nodes(conn, well_id)
-        db_update_well_sections_meta(conn, well_id, template_key, version, now)
-        _insert_node_recursive(conn, well_id, parent_id=None, node=templ["root"], now=now)
-
-
-def _insert_node_recursive(conn, well_id: str, parent_id: Optional[str], node: Dict[str, Any], now: str) -> None:
-    node_id = uuid4_str()
-    node_key = node["node_key"]
-    title = node["title"]
-    node_type = node["node_type"]
-    order_index = int(node.get("order", 0))
-
-    is_enabled = 1
-    is_selected = 0
-
-    if node_type in ("SECTION", "ITEM"):
-        is_enabled = 1 if node.get("enabled", True) else 0
-    if node_type == "SECTION":
-        is_selected = 1 if node.get("selected", False) else 0
-
-    default_state = node.get("default_state")
-    state_json_str = json.dumps(default_state, ensure_ascii=False) if default_state else None
-
-    db_insert_node(
-        conn,
-        node_id=node_id,
-        well_id=well_id,
-        parent_id=parent_id,
-        node_key=node_key,
-        title=title,
-        node_type=node_type,
-        order_index=order_index,
-        is_enabled=is_enabled,
-        is_selected=is_selected,
-        is_completed=0,
-        state_json=state_json_str,
-        created_at=now,
-        updated_at=now,
-    )
-
-    for ch in node.get("children", []) or []:
-        _insert_node_recursive(conn, well_id, parent_id=node_id, node=ch, now=now)
+    db_delete_nodes(conn, well_id)
+    db_update_well_sections_meta(conn, well_id, template_key, version, now)
+    db_insert_nodes(conn, _collect_nodes(well_id, templ["root"], now))
+
+
+def _collect_nodes(well_id: str, root: Dict[str, Any], now: str) -> List[Tuple[Any, ...]]:
+    """Flatten the template tree into insert rows, parents before children."""
+    rows: List[Tuple[Any, ...]] = []
+    stack: List[Tuple[Optional[str], Dict[str, Any]]] = [(None, root)]
+    while stack:
+        parent_id, node = stack.pop()
+        node_id = uuid4_str()
+        node_type = node["node_type"]
+
+        is_enabled = 1
+        is_selected = 0
+
+        if node_type in ("SECTION", "ITEM"):
+            is_enabled = 1 if node.get("enabled", True) else 0
+        if node_type == "SECTION":
+            is_selected = 1 if node.get("selected", False) else 0
+
+        state_json_str = node.get("_state_json_cached")
+        if state_json_str is None:
+            default_state = node.get("default_state")
+            state_json_str = json.dumps(default_state, ensure_ascii=False) if default_state else None
+
+        rows.append(
+            (
+                node_id, well_id, parent_id, node["node_key"], node["title"], node_type,
+                int(node.get("order", 0)),
+                is_enabled, is_selected, 0, state_json_str,
+                now, now,
+            )
+        )
+        # reversed so siblings come off the stack in template order
+        stack.extend((node_id, ch) for ch in reversed(node.get("children", []) or []))
+    return rows
 
 
 # -----------------------------
@@ -233,28 +266,9 @@ def _insert_node_recursive(conn, well_id: str, parent_id: Optional[str], node: D
 # -----------------------------
 def set_section_selected(conn, well_id: str, node_key: str, selected: bool) -> None:
     now = iso_now()
-    with conn:
-        conn.execute(
-            """
-            UPDATE well_section_nodes
-            SET is_selected = ?, updated_at = ?
-            WHERE well_id = ? AND node_key = ? AND node_type = 'SECTION'
-            """,
-            (1 if selected else 0, now, well_id, node_key),
-        )
+    conn.execute(_SQL_SET_SECTION_SELECTED, (1 if selected else 0, now, well_id, node_key))
 
 
 def get_selected_sections(conn, well_id: str) -> List[str]:
-    rows = conn.execute(
-        """
-        SELECT node_key
-        FROM well_section_nodes
-        WHERE well_id = ?
-          AND node_type = 'SECTION'
-          AND is_enabled = 1
-          AND is_selected = 1
-        ORDER BY order_index ASC
-        """,
-        (well_id,),
-    ).fetchall()
+    rows = conn.execute(_SQL_SELECTED_SECTIONS, (well_id,)).fetchall()
     return [r[0] for r in rows]
\ No newline at end of file
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -21,9 +22,27 @@ def template_path(template_key: str, version: int) -> Path:
     return _templates_dir() / f"{template_key}.v{version}.json"
 
 
+@lru_cache(maxsize=32)
 def load_template(template_key: str, version: int) -> Dict[str, Any]:
+    # Template files don't change while the app runs, so each one is parsed
+    # once. The returned dict is shared between callers: treat it as
+    # read-only (apply_rules works on its own copy).
     path = template_path(template_key, version)
     if not path.exists():
         raise FileNotFoundError(f"Section template file not found: {path}")
     with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
\ No newline at end of file
+        template = json.load(f)
+    _cache_state_json(template["root"])
+    return template
+
+
+def _cache_state_json(root: Dict[str, Any]) -> None:
+    # Serialize each node's default_state once per template; every well built
+    # from it stores the same state_json text.
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        default_state = node.get("default_state")
+        if default_state:
+            node["_state_json_cached"] = json.dumps(default_state, ensure_ascii=False)
+        stack.extend(node.get("children", []) or [])
\ No newline at end of file
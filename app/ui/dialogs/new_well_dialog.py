@@ -12,7 +12,7 @@ from PySide6.QtWidgets import (
     QMessageBox,
 )
 
-from app.core.canonical import canonical_well_name
+from app.core.canonical import canonical_well_name, is_canonical_text
 
 
 class NewWellDialog(QDialog):
@@ -26,6 +26,13 @@ class NewWellDialog(QDialog):
     - Operation type selection is required.
     """
 
+    OPERATION_TYPES = (
+        "Directional Drilling",
+        "Underreamer",
+        "RSS",
+        "RSS with Underreamer",
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -56,14 +63,8 @@ class NewWellDialog(QDialog):
         self.cmb_operation.addItem("Please select the operation type from the list.")
         self.cmb_operation.model().item(0).setEnabled(False)
         self.cmb_operation.setCurrentIndex(0)
-        self.cmb_operation.addItems(
-            [
-                "Directional Drilling",
-                "Underreamer",
-                "RSS",
-                "RSS with Underreamer",
-            ]
-        )
+        # Real options are added on first show (see showEvent).
+        self._operations_populated = False
         self.cmb_operation.currentIndexChanged.connect(self._on_text_changed)
         layout.addWidget(self.cmb_operation)
 
@@ -85,6 +86,14 @@ class NewWellDialog(QDialog):
 
         self.edt_name.setFocus(Qt.TabFocusReason)
 
+    def showEvent(self, event) -> None:
+        if not self._operations_populated:
+            # Appending after the placeholder keeps index 0 current, so no
+            # currentIndexChanged is emitted.
+            self.cmb_operation.addItems(list(self.OPERATION_TYPES))
+            self._operations_populated = True
+        super().showEvent(event)
+
     def well_name(self) -> str:
         """
         Returns the normalized well name (canonical form).
@@ -103,7 +112,8 @@ class NewWellDialog(QDialog):
         raw = self.edt_name.text() or ""
         cur = self.edt_name.cursorPosition()
 
-        normalized = canonical_well_name(raw)
+        # Plain uppercase typing is already canonical: skip the full pass.
+        normalized = raw if is_canonical_text(raw) else canonical_well_name(raw)
 
         if normalized != raw:
             # Prevent recursion on setText
@@ -50,6 +50,8 @@ class NozzleDialog(QDialog):
         self.setModal(True)
 
         self._result: Optional[NozzleDialogResult] = None
+        # (count, size) spinners per table row, kept in row order.
+        self._spinboxes: List[Tuple[QSpinBox, QSpinBox]] = []
 
         root = QVBoxLayout(self)
         root.setContentsMargins(16, 16, 16, 16)
@@ -140,21 +142,16 @@ class NozzleDialog(QDialog):
 
         self.table.setCellWidget(row, 0, sp_count)
         self.table.setCellWidget(row, 1, sp_size)
+        self._spinboxes.append((sp_count, sp_size))
 
         # Select newly added row
         self.table.selectRow(row)
 
     def _read_lines(self) -> List[NozzleLine]:
         lines: List[NozzleLine] = []
-        for row in range(self.table.rowCount()):
-            w_count = self.table.cellWidget(row, 0)
-            w_size = self.table.cellWidget(row, 1)
-
-            if not isinstance(w_count, QSpinBox) or not isinstance(w_size, QSpinBox):
-                continue
-
-            c = int(w_count.value())
-            s = int(w_size.value())
+        for sp_count, sp_size in self._spinboxes:
+            c = sp_count.value()
+            s = sp_size.value()
 
             if c <= 0 or s <= 0:
                 continue
@@ -174,11 +171,13 @@ class NozzleDialog(QDialog):
         if row < 0:
             return
         self.table.removeRow(row)
+        del self._spinboxes[row]
         if self.table.rowCount() > 0:
             self.table.selectRow(min(row, self.table.rowCount() - 1))
 
     def _on_clear(self) -> None:
         self.table.setRowCount(0)
+        self._spinboxes.clear()
         self._append_line(count=1, size_32nds=9)
 
     def _on_ok(self) -> None:
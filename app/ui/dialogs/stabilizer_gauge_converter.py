@@ -1,25 +1,57 @@
 # app/ui/dialogs/stabilizer_gauge_converter.py
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QIntValidator
+from PySide6.QtGui import QFont, QIntValidator
 from PySide6.QtWidgets import (
+    QApplication,
     QDialog,
-    QVBoxLayout,
-    QHBoxLayout,
+    QGridLayout,
     QLabel,
     QLineEdit,
     QPushButton,
     QMessageBox,
 )
 
+from app.core.hole_section_calcs import gauge_inches
+from app.ui.layouts import PAGE_MARGIN, PAGE_SPACING
+
+
+# Built on first use (needs a QApplication), then shared by every dialog.
+_TITLE_FONT: Optional[QFont] = None
+
+
+def _title_font() -> QFont:
+    global _TITLE_FONT
+    if _TITLE_FONT is None:
+        font = QFont(QApplication.font())
+        font.setBold(True)
+        _TITLE_FONT = font
+    return _TITLE_FONT
+
+
+_MISSING_FIELD_STYLE = "QLineEdit { border: 1px solid #d9534f; }"
+
+# Validators keep no per-widget state, so one per range serves every field and
+# every dialog. Parented to the application so they outlive any dialog.
+_INT_VALIDATORS: Dict[Tuple[int, int], QIntValidator] = {}
+
+
+def _int_validator(bottom: int, top: int) -> QIntValidator:
+    validator = _INT_VALIDATORS.get((bottom, top))
+    if validator is None:
+        validator = QIntValidator(bottom, top, QApplication.instance())
+        _INT_VALIDATORS[(bottom, top)] = validator
+    return validator
+
 
 class StabilizerGaugeConverterDialog(QDialog):
     """
     Converts a stabilizer gauge from whole + numerator/denominator into decimal inches.
     Supports a "Without Stabilizer" shortcut that returns NONE.
+
+    Reusable: keep one instance per parent and call reset() before each exec().
     """
 
     def __init__(self, parent=None) -> None:
@@ -28,56 +60,87 @@ class StabilizerGaugeConverterDialog(QDialog):
         self.setModal(True)
 
         self._result_text: Optional[str] = None
-
-        root = QVBoxLayout(self)
-        root.setContentsMargins(16, 16, 16, 16)
-        root.setSpacing(12)
-
-        title = QLabel("Select an option below...")
-        title_font = title.font()
-        title_font.setBold(True)
-        title.setFont(title_font)
-        root.addWidget(title)
-
-        btn_without = QPushButton("Without Stabilizer")
+        self._built = False
+        self._warn_box: Optional[QMessageBox] = None
+
+    def setVisible(self, visible: bool) -> None:
+        # Build the widgets right before the first show (show/open/exec all
+        # land here), early enough for the initial size to come from the layout.
+        if visible and not self._built:
+            self._ensure_built()
+        super().setVisible(visible)
+
+    def _ensure_built(self) -> None:
+        self._built = True
+
+        # One grid instead of a VBox with two nested HBoxes:
+        #   cols 0-4: whole, num, "/", den, "inch"; col 5 stretches;
+        #   cols 6-7: Cancel, OK. Title and "Without" span the full width.
+        root = QGridLayout(self)
+        root.setContentsMargins(PAGE_MARGIN, PAGE_MARGIN, PAGE_MARGIN, PAGE_MARGIN)
+        root.setVerticalSpacing(PAGE_SPACING)
+        root.setHorizontalSpacing(8)
+        root.setColumnStretch(5, 1)
+
+        title = QLabel("Select an option below...", self)
+        title.setFont(_title_font())
+        root.addWidget(title, 0, 0, 1, 8)
+
+        btn_without = QPushButton("Without Stabilizer", self)
         btn_without.clicked.connect(self._on_without)
-        root.addWidget(btn_without)
-
-        row = QHBoxLayout()
-        row.setSpacing(8)
+        root.addWidget(btn_without, 1, 0, 1, 8)
 
-        self.edt_whole = QLineEdit()
+        self.edt_whole = QLineEdit(self)
         self.edt_whole.setPlaceholderText("12")
-        self.edt_whole.setValidator(QIntValidator(0, 999, self))
+        self.edt_whole.setValidator(_int_validator(0, 999))
         self.edt_whole.setFixedWidth(60)
 
-        self.edt_num = QLineEdit()
+        self.edt_num = QLineEdit(self)
         self.edt_num.setPlaceholderText("1")
-        self.edt_num.setValidator(QIntValidator(0, 999, self))
+        self.edt_num.setValidator(_int_validator(0, 999))
         self.edt_num.setFixedWidth(60)
 
-        self.edt_den = QLineEdit()
+        self.edt_den = QLineEdit(self)
         self.edt_den.setPlaceholderText("8")
-        self.edt_den.setValidator(QIntValidator(1, 999, self))
+        self.edt_den.setValidator(_int_validator(1, 999))
         self.edt_den.setFixedWidth(60)
 
-        row.addWidget(self.edt_whole)
-        row.addWidget(self.edt_num)
-        row.addWidget(QLabel("/"))
-        row.addWidget(self.edt_den)
-        row.addWidget(QLabel("inch"))
-        row.addStretch(1)
-        root.addLayout(row)
-
-        btn_row = QHBoxLayout()
-        btn_row.addStretch(1)
-        btn_cancel = QPushButton("Cancel")
-        btn_ok = QPushButton("OK")
+        for edt in (self.edt_whole, self.edt_num, self.edt_den):
+            edt.textChanged.connect(lambda _text, e=edt: self._clear_missing(e))
+
+        root.addWidget(self.edt_whole, 2, 0)
+        root.addWidget(self.edt_num, 2, 1)
+        root.addWidget(QLabel("/", self), 2, 2)
+        root.addWidget(self.edt_den, 2, 3)
+        root.addWidget(QLabel("inch", self), 2, 4)
+
+        btn_cancel = QPushButton("Cancel", self)
+        btn_ok = QPushButton("OK", self)
         btn_cancel.clicked.connect(self.reject)
         btn_ok.clicked.connect(self._on_ok)
-        btn_row.addWidget(btn_cancel)
-        btn_row.addWidget(btn_ok)
-        root.addLayout(btn_row)
+        root.addWidget(btn_cancel, 3, 6)
+        root.addWidget(btn_ok, 3, 7)
+
+    @staticmethod
+    def _clear_missing(edt: QLineEdit) -> None:
+        if edt.styleSheet():
+            edt.setStyleSheet("")
+
+    def _warn(self, message: str) -> None:
+        # One warning box per dialog, created on first failure and reused.
+        if self._warn_box is None:
+            self._warn_box = QMessageBox(QMessageBox.Warning, "Warning", "", QMessageBox.Ok, self)
+        self._warn_box.setText(message)
+        self._warn_box.exec()
+
+    def reset(self) -> None:
+        """Clear the previous result and inputs so the instance can be shown again."""
+        self._result_text = None
+        if self._built:
+            # clear() emits textChanged, which also drops any missing-field border.
+            for edt in (self.edt_whole, self.edt_num, self.edt_den):
+                edt.clear()
+            self.edt_whole.setFocus()
 
     def result_text(self) -> Optional[str]:
         return self._result_text
@@ -87,24 +150,33 @@ class StabilizerGaugeConverterDialog(QDialog):
         self.accept()
 
     def _on_ok(self) -> None:
-        whole = (self.edt_whole.text() or "").strip()
-        num = (self.edt_num.text() or "").strip()
-        den = (self.edt_den.text() or "").strip()
+        whole = self.edt_whole.text()
+        num = self.edt_num.text()
+        den = self.edt_den.text()
         if not whole or not num or not den:
-            QMessageBox.warning(self, "Warning", "Please fill all stabilizer gauge fields.")
+            # Mark the empty fields inline (no modal box) and focus the first.
+            missing = [e for e in (self.edt_whole, self.edt_num, self.edt_den) if not e.text()]
+            for edt in missing:
+                edt.setStyleSheet(_MISSING_FIELD_STYLE)
+            missing[0].setFocus()
             return
-        try:
-            w = int(whole)
-            n = int(num)
-            d = int(den)
-        except Exception:
-            QMessageBox.warning(self, "Warning", "Please enter valid numbers.")
+        # QIntValidator treats a zero denominator as intermediate input rather
+        # than rejecting it, so it needs its own check and message.
+        if den.isdigit() and int(den) == 0:
+            self._warn("Denominator must be greater than zero.")
             return
-        if d <= 0:
-            QMessageBox.warning(self, "Warning", "Denominator must be greater than zero.")
+        # The validators only let digits through; hasAcceptableInput() also
+        # enforces their ranges (denominator >= 1), so int() below can't fail.
+        if not (
+            self.edt_whole.hasAcceptableInput()
+            and self.edt_num.hasAcceptableInput()
+            and self.edt_den.hasAcceptableInput()
+        ):
+            self._warn("Please enter valid numbers.")
             return
+        w = int(whole)
+        n = int(num)
+        d = int(den)
 
-        value = w + (n / d)
-        out = f"{value:.3f}".rstrip("0").rstrip(".")
-        self._result_text = out
+        self._result_text = gauge_inches(w, n, d)
         self.accept()
\ No newline at end of file
@@ -4,7 +4,29 @@ from __future__ import annotations
 from typing import Optional
 
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QApplication, QWidget, QLabel, QFrame
+
+from app.ui.layouts import page_layout
+
+
+_ALIGN_LEFT_VCENTER = Qt.AlignLeft | Qt.AlignVCenter
+_ALIGN_LEFT_TOP = Qt.AlignLeft | Qt.AlignTop
+_DIVIDER_SHAPE = QFrame.HLine
+_DIVIDER_SHADOW = QFrame.Sunken
+
+# Built on first use (needs a QApplication), then shared by every page.
+_TITLE_FONT: Optional[QFont] = None
+
+
+def _title_font() -> QFont:
+    global _TITLE_FONT
+    if _TITLE_FONT is None:
+        font = QFont(QApplication.font())
+        font.setBold(True)
+        font.setPointSize(font.pointSize() + 2)
+        _TITLE_FONT = font
+    return _TITLE_FONT
 
 
 class DisabledSectionPage(QWidget):
@@ -22,31 +44,24 @@ class DisabledSectionPage(QWidget):
     ) -> None:
         super().__init__(parent)
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(12)
+        layout = page_layout(self)
 
-        title = QLabel("Section Disabled")
-        title_font = title.font()
-        title_font.setBold(True)
-        title_font.setPointSize(title_font.pointSize() + 2)
-        title.setFont(title_font)
-        title.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        title = QLabel("Section Disabled", self)
+        title.setFont(_title_font())
+        title.setAlignment(_ALIGN_LEFT_VCENTER)
 
-        divider = QFrame()
-        divider.setFrameShape(QFrame.HLine)
-        divider.setFrameShadow(QFrame.Sunken)
+        divider = QFrame(self)
+        divider.setFrameShape(_DIVIDER_SHAPE)
+        divider.setFrameShadow(_DIVIDER_SHADOW)
 
-        body = QLabel(message)
+        body = QLabel(message, self)
         body.setWordWrap(True)
-        body.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        body.setAlignment(_ALIGN_LEFT_TOP)
 
-        hint = QLabel("Go to HOLE SECTION and enable the desired hole size, then return to this section.")
+        hint = QLabel("Go to HOLE SECTION and enable the desired hole size, then return to this section.", self)
         hint.setWordWrap(True)
-        hint.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        hint.setAlignment(_ALIGN_LEFT_TOP)
 
-        layout.addWidget(title)
-        layout.addWidget(divider)
-        layout.addWidget(body)
-        layout.addWidget(hint)
-        layout.addStretch(1)
\ No newline at end of file
+        for w in (title, divider, body, hint):
+            layout.addWidget(w)
+        layout.addStretch(1)
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Optional, Dict, Any, List, Union
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -55,6 +55,7 @@ from app.ui.widgets.decimal_line_edit import DecimalLineEdit
 from app.ui.widgets.time_hhmm_edit import TimeHHMMEdit
 from app.ui.widgets.date_picker_line import DatePickerLine
 from app.ui.dialogs.stabilizer_gauge_converter import StabilizerGaugeConverterDialog
+from app.ui.layouts import page_layout
 
 
 @dataclass(frozen=True)
@@ -105,6 +106,7 @@ class HoleSectionForm(QWidget):
 
         self._bit_widgets: Dict[int, Dict[str, QLineEdit | QComboBox]] = {}
         self._bit_nozzles: Dict[int, List[NozzleLine]] = {1: [], 2: []}
+        self._stabilizer_dlg: Optional[StabilizerGaugeConverterDialog] = None
 
         self.edt_day_dd: List[QLineEdit] = []
         self.edt_night_dd: List[QLineEdit] = []
@@ -132,6 +134,13 @@ class HoleSectionForm(QWidget):
         self.btn_validate: Optional[QPushButton] = None
         self.btn_save: Optional[QPushButton] = None
 
+        # Live-calc signals restart this timer, so a burst of edits/loads
+        # recomputes the derived fields once.
+        self._recalc_timer = QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(50)
+        self._recalc_timer.timeout.connect(self._recompute_derived)
+
         self._build_ui()
         self._wire_live_calcs()
         self._wire_text_normalization()
@@ -141,9 +150,7 @@ class HoleSectionForm(QWidget):
     # UI
     # ------------------------------------------------------------------
     def _build_ui(self) -> None:
-        root = QVBoxLayout(self)
-        root.setContentsMargins(16, 16, 16, 16)
-        root.setSpacing(12)
+        root = page_layout(self)
 
         hole_label = self._HOLE_LABEL_BY_KEY.get(self._hole_node_key, self._hole_node_key)
 
@@ -652,7 +659,11 @@ class HoleSectionForm(QWidget):
                 self._recompute_derived()
 
     def _open_stabilizer_converter(self, target: QLineEdit, _event) -> None:
-        dlg = StabilizerGaugeConverterDialog(parent=self)
+        # One converter per form, reset between uses.
+        dlg = self._stabilizer_dlg
+        if dlg is None:
+            dlg = self._stabilizer_dlg = StabilizerGaugeConverterDialog(parent=self)
+        dlg.reset()
         if dlg.exec() == QDialog.Accepted:
             value = dlg.result_text()
             if value is not None:
@@ -688,7 +699,7 @@ class HoleSectionForm(QWidget):
         def hook(widget, signal_name: str) -> None:
             sig = getattr(widget, signal_name, None)
             if sig is not None:
-                sig.connect(self._recompute_derived)
+                sig.connect(self._schedule_recompute_derived)
 
         # decimal edits (runs)
         for fields in self._ta_inputs.values():
@@ -748,7 +759,17 @@ class HoleSectionForm(QWidget):
         ):
             normalize_line_edit(le)
 
+    def _schedule_recompute_derived(self) -> None:
+        self._recalc_timer.start()
+
+    def _flush_recompute_derived(self) -> None:
+        # Apply a still-pending recompute before derived values are read.
+        if self._recalc_timer.isActive():
+            self._recompute_derived()
+
     def _recompute_derived(self) -> None:
+        self._recalc_timer.stop()
+
         def run_value(key: str, run: int) -> Optional[float]:
             field = self._ta_inputs.get(key, {}).get(run)
             return field.value_or_none() if field else None
@@ -850,6 +871,8 @@ class HoleSectionForm(QWidget):
     # Data collection + validation
     # ------------------------------------------------------------------
     def _collect_section_data(self) -> Dict[str, Any]:
+        self._flush_recompute_derived()
+
         # ticket is NOT validated, but we still collect it for future DB wiring
         ticket_dates: Dict[str, Optional[date]] = {
             k: w.date_value() for k, w in self._ticket_dates.items()
@@ -0,0 +1,17 @@
+# app/ui/layouts.py
+from __future__ import annotations
+
+from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+
+# Standard outer spacing for pages and dialogs (Qt layouts can't be styled via QSS).
+PAGE_MARGIN = 16
+PAGE_SPACING = 12
+
+
+def page_layout(widget: QWidget) -> QVBoxLayout:
+    """Vertical root layout for a page/dialog with the standard margins and spacing."""
+    layout = QVBoxLayout(widget)
+    layout.setContentsMargins(PAGE_MARGIN, PAGE_MARGIN, PAGE_MARGIN, PAGE_MARGIN)
+    layout.setSpacing(PAGE_SPACING)
+    return layout
\ No newline at end of file
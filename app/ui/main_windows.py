@@ -92,6 +92,9 @@ def _repo_save_enabled_hole_sizes():
         ) from e
 
 
+_DISABLED_SECTION_MESSAGE = "This hole section is disabled. Enable it in HOLE SECTION and click Apply."
+
+
 class _SimpleMessagePage(QWidget):
     def __init__(self, message: str):
         super().__init__()
@@ -133,6 +136,9 @@ class MainWindow(QMainWindow):
         self._stack.addWidget(self._default_page)
         self._stack.setCurrentWidget(self._default_page)
 
+        # One page for every disabled hole section; built on first use.
+        self._disabled_page: Optional[_SimpleMessagePage] = None
+
         self._init_ui()
         self._apply_theme(self._current_theme)
 
@@ -430,11 +436,7 @@ class MainWindow(QMainWindow):
         wid = str(well_id)
 
         if node_key.startswith("HSE_") and not self._is_hole_section_enabled(wid, node_key):
-            self._show_widget(
-                _SimpleMessagePage(
-                    "This hole section is disabled. Enable it in HOLE SECTION and click Apply."
-                )
-            )
+            self._show_widget(self._get_disabled_page())
             return
 
         cache_key = (wid, node_key)
@@ -447,6 +449,11 @@ class MainWindow(QMainWindow):
         self._widget_cache[cache_key] = w
         self._show_widget(w)
 
+    def _get_disabled_page(self) -> _SimpleMessagePage:
+        if self._disabled_page is None:
+            self._disabled_page = _SimpleMessagePage(_DISABLED_SECTION_MESSAGE)
+        return self._disabled_page
+
     def _route_node_to_widget(self, well_id: str, node_key: str) -> QWidget:
         if node_key == "WELL_NAME":
             op_type = ""
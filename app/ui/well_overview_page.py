@@ -4,7 +4,9 @@ from __future__ import annotations
 from typing import Optional
 
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
+from PySide6.QtWidgets import QWidget, QLabel, QFrame
+
+from app.ui.layouts import page_layout
 
 
 class WellOverviewPage(QWidget):
@@ -19,9 +21,7 @@ class WellOverviewPage(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(12)
+        layout = page_layout(self)
 
         title = QLabel("Well Overview")
         title_font = title.font()
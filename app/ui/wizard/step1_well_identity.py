@@ -331,15 +331,15 @@ class Step1WellIdentity(QWidget):
 
         try:
             identity_repo.save_identity(self._well_id, data)
-            with get_connection() as conn:
-                conn.execute(
-                    """
-                    UPDATE wells
-                    SET well_name = ?, step1_done = 1, updated_at = ?
-                    WHERE well_id = ?
-                    """,
-                    (new_name, now, self._well_id),
-                )
+            conn = get_connection()
+            conn.execute(
+                """
+                UPDATE wells
+                SET well_name = ?, step1_done = 1, updated_at = ?
+                WHERE well_id = ?
+                """,
+                (new_name, now, self._well_id),
+            )
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save Step 1.\n\nDetails:\n{e!r}")
             return False
@@ -16,6 +16,8 @@ from PySide6.QtWidgets import (
     QSizePolicy,
 )
 
+from app.ui.layouts import page_layout
+
 
 class Step3HoleProgram(QWidget):
     """
@@ -30,7 +32,7 @@ class Step3HoleProgram(QWidget):
       - HOLE_SECTION -> Step3HoleProgram
       - Clicking a hole size node:
           enabled -> HoleSectionForm
-          disabled -> DisabledSectionPage message
+          disabled -> MainWindow's disabled-section message page (_SimpleMessagePage)
     """
 
     enabled_node_keys_changed = Signal(str, object)  # (well_id, enabled_set)
@@ -64,9 +66,7 @@ class Step3HoleProgram(QWidget):
     # UI
     # ------------------------------------------------------------------
     def _build_ui(self) -> None:
-        root = QVBoxLayout(self)
-        root.setContentsMargins(16, 16, 16, 16)
-        root.setSpacing(12)
+        root = page_layout(self)
 
         title = QLabel("HOLE SECTION - Enable / Disable Sections")
         title_font = title.font()
@@ -121,27 +121,18 @@ class WizardNewWell(QWidget):
     def _handle_step3_next(self) -> None:
         # MVP: Step3 is UI-only for now; mark done.
         now = iso_now()
-        with self.conn:
-            self.conn.execute(
-                """
-                UPDATE wells
-                SET step3_done = 1, updated_at = ?
-                WHERE well_id = ?
-                """,
-                (now, self.well_id),
-            )
+        self.conn.execute(
+            """
+            UPDATE wells
+            SET step3_done = 1, updated_at = ?
+            WHERE well_id = ?
+            """,
+            (now, self.well_id),
+        )
 
         self.well_created.emit(self.well_id)
         self.close()
 
-    def closeEvent(self, event) -> None:
-        try:
-            if getattr(self, "conn", None) is not None:
-                self.conn.close()
-        except Exception:
-            pass
-        super().closeEvent(event)
-
     # ----------------------------
     # UI helpers
     # ----------------------------